@@ -0,0 +1,20 @@
+import logging
+from time import sleep
+
+from ...ypackage.core.background import map_in_order
+
+logger = logging.getLogger(__name__)
+
+
+def work(item: int) -> int:
+    sleep(0.01 * (5 - item))
+    logger.info(f"Görev {item}")
+    return item * item
+
+
+def test_map_in_order(caplog):
+    with caplog.at_level(logging.INFO):
+        results = map_in_order(work, range(5), jobs=4)
+
+    assert results == [0, 1, 4, 9, 16]
+    assert [record.getMessage() for record in caplog.records] == [f"Görev {i}" for i in range(5)]
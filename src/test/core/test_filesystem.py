@@ -0,0 +1,339 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os import umask
+from pathlib import Path
+from threading import Thread
+from urllib.parse import urlsplit
+
+import pytest
+
+from ...ypackage.core import filesystem
+from ...ypackage.core.filesystem import (batched_writes, execute_rename_plan,
+                                         file_digest, find_in_file,
+                                         find_in_mapped_file,
+                                         iter_dirs, iter_files,
+                                         list_nonhidden_dirs,
+                                         list_nonhidden_files,
+                                         listdir_grouped,
+                                         plan_renames, read_rename_journal,
+                                         read_file_from_url,
+                                         read_files_from_urls,
+                                         read_part_of_file,
+                                         read_part_of_mapped_file,
+                                         undo_rename_journal,
+                                         write_chunks_to_file, write_to_file)
+from ...ypackage.model.cache import HttpCache
+from ...ypackage.model.filesystem import IgnoreMatcher, Rename
+
+FILES = {
+    "/YEmreAk/YLib/master/SUMMARY.md": "# YLib\n",
+    "/YEmreAk/YPython/master/SUMMARY.md": "# YPython\n",
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    proxied = []
+
+    def do_GET(self):
+        # Vekil sunucu olarak kullanıldığında istek tam URL ile gelir
+        path = urlsplit(self.path).path
+        if path != self.path:
+            Handler.proxied.append((self.path, self.headers.get("Proxy-Authorization")))
+
+        if path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/YEmreAk/YLib/master/SUMMARY.md")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        content = FILES.get(path)
+        if content is None:
+            self.send_error(404)
+            return
+
+        etag = f'"{len(content)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = content.encode("utf-8")
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_read_file_from_url(server_url):
+    assert read_file_from_url(server_url + "/YEmreAk/YLib/master/SUMMARY.md") == "# YLib\n"
+    assert read_file_from_url(server_url + "/redirect") == "# YLib\n"
+    assert read_file_from_url(server_url + "/missing") == ""
+
+
+def test_read_file_from_url_with_proxy(server_url, monkeypatch):
+    for name in ("no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("http_proxy", server_url.replace("http://", "http://user:pass@"))
+    Handler.proxied.clear()
+
+    url = "http://ypackage.invalid/YEmreAk/YLib/master/SUMMARY.md"
+    assert read_file_from_url(url) == "# YLib\n"
+    assert Handler.proxied == [(url, "Basic dXNlcjpwYXNz")]
+
+
+def test_read_files_from_urls(server_url):
+    urls = [server_url + path for path in FILES] + [server_url + "/missing"]
+    assert read_files_from_urls(urls, jobs=3) == ["# YLib\n", "# YPython\n", ""]
+
+
+def test_read_file_from_url_with_cache(server_url):
+    url = server_url + "/YEmreAk/YLib/master/SUMMARY.md"
+    cache = HttpCache(Path("temp_http.json"))
+
+    assert read_file_from_url(url, cache=cache) == "# YLib\n"
+    assert cache.get_headers(url) == {"If-None-Match": '"7"'}
+
+    cache.entries[url][HttpCache.ATTR_CONTENT] = "# Cached\n"
+    assert read_file_from_url(url, cache=cache) == "# Cached\n", "304 yanıtında önbellek kullanılmalı"
+
+
+def test_write_to_file(tmp_path):
+    filepath = tmp_path / "temp.md"
+    filepath.write_text("Eski", encoding="utf-8")
+    filepath.chmod(0o600)
+
+    assert write_to_file(filepath, "Yeni\n")
+    assert filepath.read_text(encoding="utf-8") == "Yeni\n"
+    assert filepath.stat().st_mode & 0o777 == 0o600, "Dosya izinleri korunmalı"
+    assert [path.name for path in tmp_path.iterdir()] == ["temp.md"], "Geçici dosya kalmamalı"
+
+    assert not write_to_file(tmp_path / "yok" / "temp.md", "Yeni")
+    assert [path.name for path in tmp_path.iterdir()] == ["temp.md"]
+
+    old_umask = umask(0o022)
+    try:
+        assert write_to_file(tmp_path / "new.md", "Yeni")
+    finally:
+        umask(old_umask)
+    assert (tmp_path / "new.md").stat().st_mode & 0o777 == 0o644, "Yeni dosyalar umask'a uymalı"
+
+    linkpath = tmp_path / "README.md"
+    linkpath.symlink_to("temp.md")
+    assert write_to_file(linkpath, "# B\n")
+    assert linkpath.is_symlink(), "Sembolik bağlantı korunmalı"
+    assert filepath.read_text(encoding="utf-8") == "# B\n"
+
+
+def test_write_chunks_to_file(tmp_path):
+    filepath = tmp_path / "CHANGELOG.md"
+
+    assert write_chunks_to_file(filepath, (f"- {i}\n" for i in range(1000)))
+    content = filepath.read_text(encoding="utf-8")
+    assert content == "".join(f"- {i}\n" for i in range(1000))
+
+    mtime = filepath.stat().st_mtime_ns
+    digest = file_digest(filepath)
+    assert not write_chunks_to_file(filepath, iter([content[:10], content[10:]])), "Aynı içerik yazılmamalı"
+    assert filepath.stat().st_mtime_ns == mtime
+    assert [path.name for path in tmp_path.iterdir()] == ["CHANGELOG.md"], "Geçici dosya kalmamalı"
+
+    assert write_chunks_to_file(filepath, ["Yeni"])
+    assert file_digest(filepath) != digest
+
+
+def test_batched_writes(tmp_path):
+    filepaths = [tmp_path / f"temp{i}.md" for i in range(3)]
+
+    with batched_writes():
+        for filepath in filepaths:
+            assert write_to_file(filepath, filepath.name)
+            assert filepath.read_text(encoding="utf-8") == filepath.name, "Yazılan dosya hemen okunabilmeli"
+
+        with batched_writes():
+            write_to_file(filepaths[0], "İç")
+        assert filesystem._pending_dirs == {tmp_path}, "İç blok diske işlememeli"
+
+    assert filesystem._pending_dirs is None
+    assert filepaths[0].read_text(encoding="utf-8") == "İç"
+
+
+PART_CONTENT = (
+    "Başlık\n"
+    "<!-- Index -->\n"
+    "* Çağrı\n"
+    "<!--Index--> <!--Index-->\n"
+    "Dışarıda\n"
+    "  <!--  Index-->\n"
+    "Son\n"
+)
+
+
+def test_find_in_mapped_file(tmp_path):
+    filepath = tmp_path / "temp.md"
+    filepath.write_text(PART_CONTENT, encoding="utf-8")
+
+    for pattern in ["Index", "\\* (Ç)(a)", "(Son)|(Baş)"]:
+        assert find_in_mapped_file(pattern, filepath) == find_in_file(pattern, filepath)
+
+    filepath.write_text("", encoding="utf-8")
+    assert find_in_mapped_file("Index", filepath) == []
+
+
+def test_read_part_of_mapped_file(tmp_path):
+    filepath = tmp_path / "temp.md"
+
+    for content in [PART_CONTENT, PART_CONTENT.replace("\n", "\r\n"), PART_CONTENT.rstrip("\n"), ""]:
+        filepath.write_bytes(content.encode("utf-8"))
+        expected = read_part_of_file(filepath, "<!--Index-->")
+        assert read_part_of_mapped_file(filepath, "<!--Index-->") == expected
+
+    filepath.write_text(PART_CONTENT, encoding="utf-8")
+    assert read_part_of_mapped_file(filepath, "<!--Index-->") == "* Çağrı\nSon\n"
+
+
+def make_files(root: Path, filepaths: list):
+    for filepath in filepaths:
+        filepath = root / filepath
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(filepath.name, encoding="utf-8")
+
+
+def list_files(root: Path) -> list:
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("*"))
+
+
+def test_plan_renames(tmp_path):
+    make_files(tmp_path, ["read.md", "sub/read.md", "sub/other.md"])
+
+    plan = plan_renames(tmp_path, "read", "me")
+    assert [(rename.source.name, rename.target.name) for rename in plan.renames] == [("read.md", "me.md")]
+    assert (tmp_path / "read.md").exists(), "Plan dosya sistemini değiştirmemeli"
+
+    assert execute_rename_plan(plan_renames(tmp_path, "(re)(ad)", "$2$1", recursive=True))
+    assert list_files(tmp_path) == ["adre.md", "sub", "sub/adre.md", "sub/other.md"]
+
+
+def test_plan_renames_with_ignore(tmp_path):
+    make_files(tmp_path, ["read.md", "node_modules/read.md", "sub/read.md", "sub/read.log"])
+    (tmp_path / "sub" / ".gitignore").write_text("*.log\n", encoding="utf-8")
+
+    ignore = IgnoreMatcher.from_path(tmp_path, ["node_modules"], filenames=(".gitignore",))
+    plan = plan_renames(tmp_path, "read", "me", recursive=True, ignore=ignore)
+    assert sorted(rename.source.relative_to(tmp_path).as_posix() for rename in plan.renames) == [
+        "read.md", "sub/read.md"
+    ]
+
+
+def test_plan_renames_dirs_bottom_up(tmp_path):
+    make_files(tmp_path, ["a/a/a/file.md"])
+
+    plan = plan_renames(tmp_path, "^a$", "b", recursive=True, dir_mode=True)
+    assert [len(rename.source.parts) for rename in plan.renames] == sorted(
+        [len(rename.source.parts) for rename in plan.renames], reverse=True
+    )
+
+    assert execute_rename_plan(plan)
+    assert list_files(tmp_path) == ["b", "b/b", "b/b/b", "b/b/b/file.md"]
+
+
+def test_plan_renames_conflicts(tmp_path):
+    make_files(tmp_path, ["a1.md", "a2.md", "b.md"])
+
+    plan = plan_renames(tmp_path, r"a\d", "b")
+    assert not plan.is_valid()
+    assert len(plan.conflicts) == 2
+    assert not execute_rename_plan(plan)
+    assert list_files(tmp_path) == ["a1.md", "a2.md", "b.md"]
+
+    assert not plan_renames(tmp_path, "a1.md", "x/y").is_valid()
+
+
+def test_plan_renames_chain_and_cycle(tmp_path):
+    make_files(tmp_path, ["a.md", "aa.md", "aaa.md"])
+
+    assert execute_rename_plan(plan_renames(tmp_path, r"^(a+)\.", "a$1."))
+    assert list_files(tmp_path) == ["aa.md", "aaa.md", "aaaa.md"]
+    assert (tmp_path / "aaaa.md").read_text(encoding="utf-8") == "aaa.md"
+
+    make_files(tmp_path, ["ab.md", "ba.md"])
+
+    assert execute_rename_plan(plan_renames(tmp_path, r"^(a|b)(a|b)\.", "$2$1."))
+    assert (tmp_path / "ab.md").read_text(encoding="utf-8") == "ba.md"
+    assert (tmp_path / "ba.md").read_text(encoding="utf-8") == "ab.md"
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_execute_rename_plan_with_journal(tmp_path, jobs):
+    root = tmp_path / "root"
+    make_files(root, [f"read{i}/read{j}.md" for i in range(4) for j in range(3)] + ["ab.md", "ba.md"])
+    before = list_files(root)
+
+    journal = tmp_path / "rename.journal"
+    plan = plan_renames(root, "read", "me", recursive=True)
+    plan.renames += plan_renames(root, "read", "me", recursive=True, dir_mode=True).renames
+    plan.renames += plan_renames(root, r"^(a|b)(a|b)\.", "$2$1.").renames
+
+    assert execute_rename_plan(plan, jobs=jobs, journal=journal)
+    assert "read" not in "".join(list_files(root))
+    assert len(read_rename_journal(journal)) == len(plan)
+
+    assert undo_rename_journal(journal, jobs=jobs)
+    assert list_files(root) == before
+    assert (root / "ab.md").read_text(encoding="utf-8") == "ab.md"
+
+
+def test_execute_rename_plan_with_non_utf8_name(tmp_path):
+    filepath = tmp_path / "root" / "read\udcff.md"
+    filepath.parent.mkdir()
+    filepath.touch()
+
+    journal = tmp_path / "rename.journal"
+    assert execute_rename_plan(plan_renames(filepath.parent, "read", "me"), journal=journal)
+    assert read_rename_journal(journal) == [Rename(filepath, filepath.with_name("me\udcff.md"))]
+
+    assert undo_rename_journal(journal)
+    assert filepath.exists()
+
+
+def test_execute_rename_plan_stops_on_error(tmp_path):
+    make_files(tmp_path, ["a/read.md"])
+    plan = plan_renames(tmp_path, "read", "me", recursive=True)
+    plan.renames += plan_renames(tmp_path, "^a$", "b", dir_mode=True).renames
+    (tmp_path / "a" / "read.md").unlink()
+
+    assert not execute_rename_plan(plan)
+    assert (tmp_path / "a").exists(), "Hata sonrası üst seviyeye geçilmemeli"
+
+
+def test_iter_dirs_and_files(tmp_path):
+    make_files(tmp_path, ["b.md", "a.md", ".gizli.md", "d/x.md", "c/x.md", ".git/x", "node_modules/x.js"])
+
+    assert [path.name for path in iter_dirs(tmp_path, sort=True)] == ["c", "d", "node_modules"]
+    assert [path.name for path in iter_files(tmp_path, sort=True)] == ["a.md", "b.md"]
+    assert sorted(iter_files(tmp_path, include_hidden=True)) == sorted(
+        tmp_path / name for name in [".gizli.md", "a.md", "b.md"]
+    )
+    assert list(iter_dirs(tmp_path, ignore=["node_modules"], sort=True)) == [tmp_path / "c", tmp_path / "d"]
+
+    assert list_nonhidden_dirs(tmp_path) == list(iter_dirs(tmp_path, sort=True))
+    assert list_nonhidden_files(tmp_path) == list(iter_files(tmp_path, sort=True))
+    assert listdir_grouped(tmp_path, ignore_folders=["node_modules"]) == (
+        [tmp_path / "c", tmp_path / "d"],
+        [tmp_path / "a.md", tmp_path / "b.md"]
+    )
@@ -0,0 +1,94 @@
+from datetime import datetime
+
+from ...ypackage.core import github
+from ...ypackage.core.gitbook import create_changelog, find_changelog_marker
+from ...ypackage.model.github import Commit
+
+REPO_URL = "https://github.com/yedhrab/YPackage"
+
+
+class FakeHistory:
+
+    def __init__(self, titles: list):
+        self.commits = []
+        self.add(titles)
+        self.requested = []
+
+    def add(self, titles: list):
+        for title in titles:
+            index = len(self.commits)
+            self.commits.insert(0, Commit(f"{index:040x}", title, "Yunus Emre", datetime(2020, 1, 1, 0, 0, index)))
+
+    def iter_commits(self, path, since=None, backend="git"):
+        self.requested.append(since)
+        for commit in self.commits:
+            if commit.hash == since:
+                break
+            yield commit
+
+    def is_ancestor(self, path, commit_hash, ref="HEAD"):
+        return any(commit.hash == commit_hash for commit in self.commits)
+
+
+def install(monkeypatch, history: FakeHistory):
+    monkeypatch.setattr(github, "iter_commits", history.iter_commits)
+    monkeypatch.setattr(github, "is_ancestor", history.is_ancestor)
+
+
+def read_titles(filepath):
+    return [line.split("[")[1].split("]")[0] for line in filepath.read_text(encoding="utf-8").splitlines()
+            if line.startswith("- ")]
+
+
+def test_create_changelog(tmp_path, monkeypatch):
+    history = FakeHistory(["Bir", "İki", "Üç"])
+    install(monkeypatch, history)
+
+    create_changelog(tmp_path, repo_url=REPO_URL)
+    filepath = tmp_path / "CHANGELOG.md"
+    content = filepath.read_text(encoding="utf-8")
+    assert content.startswith("# 👀 Neler değişti\n\n## 📋 Tüm Değişiklikler\n\n<!--Son commit: ")
+    assert read_titles(filepath) == ["Üç", "İki", "Bir"]
+    assert find_changelog_marker(filepath) == history.commits[0].hash
+
+    mtime = filepath.stat().st_mtime_ns
+    create_changelog(tmp_path, repo_url=REPO_URL)
+    assert filepath.stat().st_mtime_ns == mtime, "Değişiklik yoksa yazılmamalı"
+
+
+def test_create_changelog_incremental(tmp_path, monkeypatch):
+    history = FakeHistory(["Bir", "İki"])
+    install(monkeypatch, history)
+    create_changelog(tmp_path, repo_url=REPO_URL)
+
+    history.add(["💫 YGitBookIntegration"])
+    filepath = tmp_path / "CHANGELOG.md"
+    marker = find_changelog_marker(filepath)
+    create_changelog(tmp_path, repo_url=REPO_URL)
+    assert find_changelog_marker(filepath) == marker, "Sadece atlanan commitler varsa dosya değişmemeli"
+
+    history.add(["Dört", "Beş"])
+    create_changelog(tmp_path, repo_url=REPO_URL)
+    assert history.requested[-1] == marker
+    assert read_titles(filepath) == ["Beş", "Dört", "İki", "Bir"]
+    assert find_changelog_marker(filepath) == history.commits[0].hash
+
+
+def test_create_changelog_rewritten_history(tmp_path, monkeypatch):
+    install(monkeypatch, FakeHistory(["Bir", "İki"]))
+    create_changelog(tmp_path, repo_url=REPO_URL)
+
+    history = FakeHistory(["Yeni"])
+    history.commits[0].hash = "f" * 40
+    install(monkeypatch, history)
+    create_changelog(tmp_path, repo_url=REPO_URL)
+
+    assert history.requested == [None]
+    assert read_titles(tmp_path / "CHANGELOG.md") == ["Yeni"]
+
+
+def test_create_changelog_without_commits(tmp_path, monkeypatch):
+    install(monkeypatch, FakeHistory([]))
+
+    create_changelog(tmp_path, repo_url=REPO_URL)
+    assert not (tmp_path / "CHANGELOG.md").exists()
@@ -0,0 +1,117 @@
+import os
+import subprocess
+
+import pytest
+
+from ...ypackage.core.github import (get_remote_url, is_ancestor, iter_commits,
+                                     list_commit_links, push_to_github)
+
+REPO_URL = "https://github.com/yedhrab/YPackage"
+
+
+def git(repo, *args, date="2020-04-01T12:00:00+03:00"):
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Yunus Emre",
+        "GIT_AUTHOR_EMAIL": "yemreak@example.com",
+        "GIT_COMMITTER_NAME": "Yunus Emre",
+        "GIT_COMMITTER_EMAIL": "yemreak@example.com",
+        "GIT_AUTHOR_DATE": date,
+        "GIT_COMMITTER_DATE": date,
+        "HOME": str(repo),
+    }
+    return subprocess.run(["git", *args], cwd=repo, env=env, check=True, stdout=subprocess.PIPE).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.name", "Yunus Emre")
+    git(tmp_path, "config", "user.email", "yemreak@example.com")
+    for index, message in enumerate(["İlk commit", "İkinci\n\nAçıklama\x1fsatırı", "💫 YGitBookIntegration"]):
+        (tmp_path / f"{index}.md").write_text(message, encoding="utf-8")
+        git(tmp_path, "add", "-A")
+        git(tmp_path, "commit", "-q", "-m", message, date=f"2020-04-0{index + 1}T12:00:00+03:00")
+
+    return tmp_path
+
+
+def test_iter_commits(repo):
+    commits = list(iter_commits(repo))
+    assert [commit.title for commit in commits] == ["💫 YGitBookIntegration", "İkinci", "İlk commit"]
+    assert all(commit.author == "Yunus Emre" for commit in commits)
+    assert commits[-1].date.strftime("%d/%m/%Y - %H:%M:%S %z") == "01/04/2020 - 12:00:00 +0300"
+
+    hashes = git(repo, "log", "--format=%H").decode().split()
+    assert [commit.hash for commit in commits] == hashes
+
+    assert [commit.title for commit in iter_commits(repo, since=hashes[2])] == ["💫 YGitBookIntegration", "İkinci"]
+    assert list(iter_commits(repo, since=hashes[0])) == []
+
+
+def test_iter_commits_closed_early(repo):
+    commits = iter_commits(repo)
+    assert next(commits).title == "💫 YGitBookIntegration"
+    commits.close()
+
+
+def test_list_commit_links(repo):
+    links = list_commit_links(repo, repo_url=REPO_URL, ignore_commits=["YGitBookIntegration"])
+    assert links[0].startswith("- 02/04/2020 - 12:00:00 - [İkinci](" + REPO_URL + "/commit/")
+    assert len(links) == 2
+
+
+def test_is_ancestor_and_remote_url(repo, tmp_path_factory):
+    hashes = git(repo, "log", "--format=%H").decode().split()
+    assert is_ancestor(repo, hashes[-1])
+    assert not is_ancestor(repo, "f" * 40)
+
+    assert get_remote_url(repo) == ""
+    git(repo, "remote", "add", "origin", REPO_URL + ".git")
+    assert get_remote_url(repo) == REPO_URL
+
+    assert list(iter_commits(tmp_path_factory.mktemp("empty"))) == []
+
+
+@pytest.mark.parametrize("ignore_commits, titles", [
+    ([], ["💫 YGitBookIntegration", "İkinci", "İlk commit"]),
+    (["İ"], ["💫 YGitBookIntegration"]),
+    (["re:^İ(lk|ki)", "💫"], []),
+    (["glob:İ*", "re:commit$"], ["💫 YGitBookIntegration"]),
+    (["glob:İ"], ["💫 YGitBookIntegration", "İkinci", "İlk commit"]),
+])
+def test_list_commit_links_ignore_commits(repo, ignore_commits, titles):
+    links = list_commit_links(repo, repo_url=REPO_URL, ignore_commits=ignore_commits)
+    assert [link.split("[")[1].split("]")[0] for link in links] == titles
+
+
+def test_push_to_github(repo, tmp_path_factory):
+    filepaths = [repo / "README.md", repo / "a [1]*.md", repo / "alt dizin" / "SUMMARY.md"]
+    filepaths[2].parent.mkdir()
+    for filepath in filepaths:
+        filepath.write_text("Selam", encoding="utf-8")
+    (repo / "a.md").write_text("Eklenmemeli", encoding="utf-8")
+
+    result = push_to_github(repo, filepaths, "📝 Güncelleme", push=False)
+    assert result.staged and result.committed and not result.pushed
+    assert not result.errors
+    assert git(repo, "log", "-1", "--format=%s").decode().strip() == "📝 Güncelleme"
+    assert sorted(git(repo, "show", "--name-only", "--format=").decode().splitlines()) == [
+        "README.md", "a [1]*.md", "alt dizin/SUMMARY.md"
+    ]
+
+    result = push_to_github(repo, filepaths, "📝 Güncelleme")
+    assert result.staged and not result.committed, "Değişiklik yoksa commit oluşturulmamalı"
+
+    filepaths[0].write_text("Yeni", encoding="utf-8")
+    result = push_to_github(repo, filepaths[:1], "📝 Güncelleme")
+    assert result.committed and not result.pushed, "origin olmadan push başarısız olmalı"
+    assert [str(error) for error in result.errors] == ["git push -u origin HEAD"]
+
+    remote = tmp_path_factory.mktemp("remote")
+    git(remote, "init", "-q", "--bare")
+    git(repo, "remote", "add", "origin", str(remote))
+    filepaths[0].write_text("Daha yeni", encoding="utf-8")
+    assert push_to_github(repo, filepaths[:1], "📝 Güncelleme").pushed
+
+    assert not push_to_github(repo, [], "📝 Güncelleme").staged
@@ -144,6 +144,9 @@ def test_find_first_header_from_file():
     header = find_first_header_from_file(TEMP_PATH)
     assert header == Header(1, "📅 Vize \| CNaT")
 
+    header = find_first_header_from_file(TEMP_PATH, limit=32)
+    assert header is None
+
     headers = find_all_headers_from_file(WRONG_PATH)
     assert not headers
 
@@ -153,6 +156,10 @@ def test_update_title_of_markdownfile():
     assert update_title_of_markdownfile("Hello", TEMP_PATH)
     assert Header.find_first_in_markdownfile(TEMP_PATH).name == "Hello"
 
+    mtime = TEMP_PATH.stat().st_mtime_ns
+    assert not update_title_of_markdownfile("Hello", TEMP_PATH), "Değişiklik yoksa yazmamalı"
+    assert TEMP_PATH.stat().st_mtime_ns == mtime
+
 
 @customdir
 def test_generate_nonmarkdown_fileliststring():
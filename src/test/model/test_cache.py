@@ -0,0 +1,76 @@
+from os import makedirs
+from pathlib import Path
+from shutil import rmtree
+
+from ...ypackage.core.gitbook import (generate_summary_fileliststring,
+                                      generate_summary_fingerprint)
+from ...ypackage.core.markdown import generate_name_for_markdownfile
+from ...ypackage.model.cache import SummaryCache, TitleCache
+from ...ypackage.model.filesystem import DirectoryTree
+
+TEMP_DIRPATH = Path("temp_cache")
+TEMP_PATH = TEMP_DIRPATH / "temp.md"
+
+
+def customdir(func):
+
+    def inner(*args, **kwargs):
+        makedirs(TEMP_DIRPATH.as_posix(), exist_ok=True)
+        TEMP_PATH.write_text("# Hello\n", encoding="utf-8")
+
+        func(*args, **kwargs)
+
+        rmtree(TEMP_DIRPATH)
+
+    return inner
+
+
+@customdir
+def test_cache():
+    cache = TitleCache.from_workdir(TEMP_DIRPATH)
+    assert cache.get(TEMP_PATH) is None
+
+    assert generate_name_for_markdownfile(TEMP_PATH, cache=cache) == "Hello"
+    assert cache.get(TEMP_PATH) == "Hello"
+    assert cache.save()
+    assert not cache.save(), "Değişiklik yoksa yazmamalı"
+
+    cache = TitleCache.from_workdir(TEMP_DIRPATH)
+    assert cache.get(TEMP_PATH) == "Hello"
+
+    TEMP_PATH.write_text("# Hello World\n", encoding="utf-8")
+    assert cache.get(TEMP_PATH) is None
+    assert generate_name_for_markdownfile(TEMP_PATH, cache=cache) == "Hello World"
+
+
+@customdir
+def test_prune():
+    cache = TitleCache.from_workdir(TEMP_DIRPATH)
+    cache.set(TEMP_PATH, "Hello")
+    cache.save()
+
+    cache = TitleCache.from_workdir(TEMP_DIRPATH)
+    cache.prune()
+    assert cache.entries, "Var olan dosyaların kayıtları silinmemeli"
+    assert not cache.changed
+
+    TEMP_PATH.unlink()
+    cache.prune()
+    assert not cache.entries
+    assert cache.changed
+
+
+@customdir
+def test_summary_cache():
+    projectpath = TEMP_DIRPATH
+    summary_cache = SummaryCache.from_workdir(projectpath)
+
+    content = generate_summary_fileliststring(projectpath, summary_cache=summary_cache)
+    assert content == "* [README.md](README.md)\n* [Hello](temp.md)\n"
+    assert summary_cache.get(".", generate_summary_fingerprint(DirectoryTree.from_path(projectpath))) == content
+
+    (projectpath / "new.md").write_text("# New\n", encoding="utf-8")
+    assert summary_cache.get(".", generate_summary_fingerprint(DirectoryTree.from_path(projectpath))) is None
+
+    content = generate_summary_fileliststring(projectpath, summary_cache=summary_cache)
+    assert content == "* [README.md](README.md)\n* [New](new.md)\n* [Hello](temp.md)\n"
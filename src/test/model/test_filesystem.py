@@ -0,0 +1,122 @@
+import re
+from os import makedirs
+from pathlib import Path
+from shutil import rmtree
+
+import pytest
+
+from ...ypackage.model.filesystem import (DirectoryTree, IgnoreMatcher,
+                                          RenameTemplate)
+
+TEMP_DIRPATH = Path("temp_tree")
+TEMP_FILES = [
+    Path("README.md"),
+    Path("a/hello.md"),
+    Path("a/yunus.py"),
+    Path("a/b/emre.py"),
+    Path(".hidden/secret.md"),
+    Path("node_modules/index.js"),
+]
+
+
+def customdir(func):
+
+    def inner(*args, **kwargs):
+        for filepath in TEMP_FILES:
+            filepath = TEMP_DIRPATH / filepath
+            makedirs(filepath.parent.as_posix(), exist_ok=True)
+            filepath.write_text("")
+
+        func(*args, **kwargs)
+
+        rmtree(TEMP_DIRPATH)
+
+    return inner
+
+
+@customdir
+def test_from_path():
+    tree = DirectoryTree.from_path(TEMP_DIRPATH, ignore=["node_modules"])
+
+    assert tree.files == [TEMP_DIRPATH / "README.md"]
+    assert [directory.path for directory in tree.dirs] == [TEMP_DIRPATH / "a"]
+
+    subtree = tree.dirs[0]
+    assert subtree.files == [TEMP_DIRPATH / "a/hello.md", TEMP_DIRPATH / "a/yunus.py"]
+    assert subtree.dirs[0].files == [TEMP_DIRPATH / "a/b/emre.py"]
+
+
+@customdir
+def test_walk():
+    tree = DirectoryTree.from_path(TEMP_DIRPATH)
+    assert [directory.path for directory in tree.walk()] == [
+        TEMP_DIRPATH,
+        TEMP_DIRPATH / "a",
+        TEMP_DIRPATH / "a/b",
+        TEMP_DIRPATH / "node_modules",
+    ]
+
+
+@customdir
+def test_from_path_with_ignore_files():
+    (TEMP_DIRPATH / ".gitignore").write_text("node_modules/\n*.py\n!/a/yunus.py\n", encoding="utf-8")
+    (TEMP_DIRPATH / "a" / ".ygitbookignore").write_text("b\n", encoding="utf-8")
+
+    tree = DirectoryTree.from_path(TEMP_DIRPATH)
+    assert [directory.path for directory in tree.walk()] == [TEMP_DIRPATH, TEMP_DIRPATH / "a"]
+    assert tree.dirs[0].files == [
+        TEMP_DIRPATH / "a/.ygitbookignore",
+        TEMP_DIRPATH / "a/hello.md",
+        TEMP_DIRPATH / "a/yunus.py"
+    ]
+
+
+@pytest.mark.parametrize("pattern, path, is_dir, expected", [
+    ("node_modules", "a/node_modules", True, True),
+    ("node_modules", "node_modules", False, True),
+    ("build/", "build", False, False),
+    ("/build", "a/build", True, False),
+    ("docs/*.md", "docs/a.md", False, True),
+    ("docs/*.md", "docs/a/b.md", False, False),
+    ("docs/**/*.md", "docs/a/b.md", False, True),
+    ("**/temp", "a/b/temp", True, True),
+    ("a/**", "a/b/c", False, True),
+    ("*.py[co]", "x.pyc", False, True),
+    ("[!a]*.md", "a.md", False, False),
+    ("\\#note", "#note", False, True),
+    ("# yorum", "# yorum", False, False),
+])
+def test_ignore_matcher(pattern, path, is_dir, expected):
+    assert IgnoreMatcher.from_patterns([pattern]).is_ignored(path, is_dir=is_dir) == expected
+
+
+def test_ignore_matcher_last_rule_wins():
+    matcher = IgnoreMatcher.from_patterns(["*.md", "!README.md", "docs/README.md"])
+    assert matcher.is_ignored("a.md")
+    assert not matcher.is_ignored("a/README.md")
+    assert matcher.is_ignored("docs/README.md")
+
+
+@pytest.mark.parametrize("to, expected", [
+    ("$2-$1", "12-Ders.md"),
+    ("${2}0", "120.md"),
+    ("${name:lower}_${2}", "ders_12.md"),
+    ("${1:upper}", "DERS.md"),
+    (r"\2\g<name>", "12Ders.md"),
+    ("$$1", "$1.md"),
+    ("", ".md"),
+])
+def test_rename_template(to, expected):
+    pattern = re.compile(r"(?P<name>[a-z]+) (\d+)", re.IGNORECASE)
+    assert RenameTemplate.from_string(to, pattern).apply("Ders 12.md") == expected
+
+
+def test_rename_template_each_match():
+    template = RenameTemplate.from_string("${1:capitalize}", re.compile(r"([a-z]+)"))
+    assert template.apply("ali veli.md") == "Ali Veli.Md"
+
+
+@pytest.mark.parametrize("to", ["$3", "${other}", "${1:unknown}"])
+def test_rename_template_invalid(to):
+    with pytest.raises(re.error):
+        RenameTemplate.from_string(to, re.compile(r"(?P<name>a)(b)"))
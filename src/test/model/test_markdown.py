@@ -3,7 +3,8 @@
 
 import pytest
 
-from ...ypackage.model.markdown import Comment, Header, Indent, Link
+from ...ypackage.model.markdown import (Comment, Header, Indent, Link, Token,
+                                        tokenize)
 
 # https://github.com/szabgab/slides/blob/main/python-programming/examples/pytest/test_class.py
 
@@ -31,6 +32,11 @@ class TestLink:
         expected = "[name1a](path1b) [name2a](path2b)"
         assert content == expected
 
+    def test_map_duplicates(self):
+        content = Link.map("[a](b) [a](b)[a](bb)", TestLink.do)
+        expected = "[aa](bb) [aa](bb)[aa](bbb)"
+        assert content == expected
+
     def test_find_all(self):
         links = Link.find_all(self.content)
         assert links == [Link('name1', 'path1'), Link('name2', 'path2')]
@@ -84,6 +90,11 @@ class TestHeader():
         expected = "## YEmreAkY\n### YPackageY\n"
         assert content == expected
 
+    def test_map_duplicates(self):
+        content = Header.map("# A\n## A\n# A", TestHeader.do)
+        expected = "## AY\n### AY\n## AY"
+        assert content == expected
+
     def test_find_all(self):
         headers = Header.find_all(self.content)
         assert headers == [Header(1, 'YEmreAk'), Header(2, 'YPackage')]
@@ -92,6 +103,13 @@ class TestHeader():
         header = Header.find_first(self.content)
         assert header == Header(1, 'YEmreAk')
 
+        assert Header.find_first("YEmreAk") is None
+
+    def test_iter_all(self):
+        headers = Header.iter_all(self.content)
+        assert next(headers) == Header(1, 'YEmreAk')
+        assert list(headers) == [Header(2, 'YPackage')]
+
     @staticmethod
     def do(header: Header):
         header.level += 1
@@ -195,3 +213,26 @@ class TestIndent():
     @staticmethod
     def do(indent: Indent):
         indent.level += 1
+
+
+class TestTokenize():
+
+    def setup_class(self):
+        self.content = "# [Title](path#anchor)\n<!--Index-->\n* [name](path)\n"
+
+    def test_tokenize(self):
+        tokens = tokenize(self.content)
+        assert tokens == [
+            Token(Header(1, "[Title](path#anchor)"), 0, 22),
+            Token(Link("Title", "path#anchor"), 2, 22),
+            Token(Comment("Index"), 23, 35),
+            Token(Link("name", "path"), 38, 50),
+        ]
+
+    def test_find_all(self):
+        assert Header.find_all(self.content) == [Header(1, "[Title](path#anchor)")]
+        assert Link.find_all(self.content) == [Link("Title", "path#anchor"), Link("name", "path")]
+        assert Comment.find_all(self.content) == [Comment("Index")]
+
+    def test_remove_all(self):
+        assert Link.remove_all(self.content) == "# \n<!--Index-->\n* \n"
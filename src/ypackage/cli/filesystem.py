@@ -2,23 +2,37 @@ import logging
 from glob import glob
 from pathlib import Path
 
-from ..core.filesystem import rename_files, rename_folders
-from ..model.filesystem import OptionParser, Options
+from ..core.filesystem import (execute_rename_plan, plan_renames,
+                               undo_rename_journal)
+from ..model.filesystem import IgnoreMatcher, OptionParser, Options
 from . import common
 
 logger = logging.getLogger(__name__)
 
 
 def rename(options: Options):
-    function = rename_folders if options.dir_mode else rename_files
-    result = function(
+    ignore = IgnoreMatcher.from_path(
+        options.workdir,
+        options.ignore,
+        filenames=(".gitignore",) if options.gitignore else ()
+    )
+
+    plan = plan_renames(
         options.workdir,
         options.pattern,
         options.to,
         ignore_case=not options.case_sensitive,
-        recursive=options.recursive
+        recursive=options.recursive,
+        dir_mode=options.dir_mode,
+        ignore=ignore
     )
 
+    if options.dry_run:
+        if plan.renames or plan.conflicts:
+            print(plan)
+        return
+
+    result = execute_rename_plan(plan, jobs=options.jobs, journal=options.journal)
     if not result:
         logger.warning(
             f"Değişiklik yapılmadı: {options.pattern=} {options.to=}"
@@ -31,6 +45,11 @@ def main():
     log_level = logging.DEBUG if args.debug else logging.INFO
     common.initialize_logging(level=log_level)
 
+    if args.undo:
+        if not undo_rename_journal(args.undo, jobs=args.jobs):
+            logger.warning(f"Geri alınacak adlandırma yok: {args.undo}")
+        return
+
     for path in args.paths:
         paths = [Path(p) for p in glob(path)]
         for path in paths:
@@ -1,38 +1,55 @@
 import logging
 from glob import glob
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from ..cli import common
 from ..core import filesystem, github, markdown
 from ..core.gitbook import (create_changelog, generate_description_section,
                             generate_readme_for_project,
                             generate_summary_for_project,
-                            read_summary_from_url)
+                            read_summaries_from_urls)
+from ..model.cache import HttpCache, SummaryCache, TitleCache
+from ..model.filesystem import DirectoryTree
 from ..model.gitbook import OptionParser, Options
 
 logger = logging.getLogger(__name__)
 
 
-def generate_readmes_by_options(options: Options):
+def generate_readmes_by_options(options: Options, tree: Optional[DirectoryTree] = None):
     if options.generate:
         generate_readme_for_project(
             options.workdir,
             options.index,
             ignore=options.ignore,
-            must_inserted=True
+            must_inserted=True,
+            tree=tree,
+            jobs=options.jobs
         )
 
 
-def recreate_summary_by_options(options: Options):
+def recreate_summary_by_options(options: Options, tree: Optional[DirectoryTree] = None):
     if options.recreate:
+        title_cache, summary_cache = None, None
+        if not options.no_cache:
+            title_cache = TitleCache.from_workdir(options.workdir)
+            summary_cache = SummaryCache.from_workdir(options.workdir)
+
         generate_summary_for_project(
             options.workdir,
             options.index,
             ignore=options.ignore,
-            must_inserted=True
+            must_inserted=True,
+            cache=title_cache,
+            summary_cache=summary_cache,
+            tree=tree
         )
 
+        for cache in (title_cache, summary_cache):
+            if cache:
+                cache.prune()
+                cache.save()
+
 
 def fix_title_of_subsummary(content: str) -> str:
     link = markdown.find_first_link(content)
@@ -59,9 +76,18 @@ def insert_description(description: str, content: str) -> str:
 def update_sub_summaries_by_options(options: Options) -> str:
     changed_filepaths = []
     if options.update:
-        for submodule in options.submodules:
-            content = read_summary_from_url(submodule.url)
+        cache = None if options.no_cache else HttpCache.from_workdir(options.workdir)
+
+        contents = read_summaries_from_urls(
+            [submodule.url for submodule in options.submodules],
+            jobs=options.jobs,
+            cache=cache
+        )
+        if cache:
+            cache.prune()
+            cache.save()
 
+        for submodule, content in zip(options.submodules, contents):
             substring = markdown.find_substrings_by_commentstring(
                 content,
                 options.index
@@ -97,7 +123,8 @@ def create_changelog_by_options(options: Options):
             repo_url=options.repo_url,
             push=options.push,
             ignore_commits=options.ignore_commits,
-            commit_msg=options.commit_msg
+            commit_msg=options.commit_msg,
+            backend=options.commit_backend
         )
 
 
@@ -105,10 +132,17 @@ def integrate(options: Options):
     logger.info(f"Entegrasyon başlatıldı: {options.workdir.absolute()}")
 
     # TODO: Summary ve README gitbook.yml dosyası ile oluşturulsun
-    generate_readmes_by_options(options)
-    recreate_summary_by_options(options)
+    tree = None
+    if options.generate or options.recreate:
+        tree = DirectoryTree.from_path(options.workdir, ignore=options.ignore)
+
+    # Dosyalar push edilmeden önce tek seferde diske işlenir
+    with filesystem.batched_writes():
+        generate_readmes_by_options(options, tree=tree)
+        recreate_summary_by_options(options, tree=tree)
+
+        changed_filepaths = update_sub_summaries_by_options(options)
 
-    changed_filepaths = update_sub_summaries_by_options(options)
     push_changed_files_to_github_by_options(changed_filepaths, options)
 
     create_changelog_by_options(options)
@@ -1,4 +1,9 @@
-from threading import Thread, Timer
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread, Timer, local
+from typing import Any, Callable, Iterable, List
+
+_buffers = local()
 
 
 def do_background(func, args=(), kwargs={}):
@@ -25,3 +30,75 @@ def delayed(duration):
 
         return inner
     return background
+
+
+class BufferingFilter(logging.Filter):
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Görev içerisinde çalışan thread'lerin raporlarını ekrana basmak yerine biriktirir"""
+        records = getattr(_buffers, "records", None)
+        if records is None:
+            return True
+
+        if not records or records[-1] is not record:
+            records.append(record)
+
+        return False
+
+
+def _run_buffered(func: Callable[[Any], Any], item: Any):
+    _buffers.records = []
+    try:
+        return func(item), None, _buffers.records
+    except Exception as error:
+        return None, error, _buffers.records
+    finally:
+        del _buffers.records
+
+
+def map_in_order(func: Callable[[Any], Any], items: Iterable[Any], jobs: int = 1) -> List[Any]:
+    """Fonksiyonu verilen elemanlara `jobs` kadar thread ile paralel uygular
+
+    Sonuçlar ve görevlerin raporları elemanların sırasına göre döndürülür, böylece \
+        çıktı sıralı çalışma ile aynı kalır
+
+    Arguments:
+        func {Callable[[Any], Any]} -- Uygulanacak fonksiyon
+        items {Iterable[Any]} -- Elemanlar
+
+    Keyword Arguments:
+        jobs {int} -- Thread sayısı, 1 ise sıralı çalışır (default: {1})
+
+    Returns:
+        List[Any] -- Sıralı sonuçlar
+
+    Examples:
+        >>> map_in_order(lambda x: x * 2, [1, 2, 3], jobs=2)
+        [2, 4, 6]
+    """
+    if jobs <= 1:
+        return [func(item) for item in items]
+
+    handlers = logging.getLogger().handlers
+    logfilter = BufferingFilter()
+    for handler in handlers:
+        handler.addFilter(logfilter)
+
+    try:
+        results = []
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(_run_buffered, func, item) for item in items]
+            for future in futures:
+                result, error, records = future.result()
+                for record in records:
+                    logging.getLogger(record.name).handle(record)
+
+                if error:
+                    raise error
+
+                results.append(result)
+
+        return results
+    finally:
+        for handler in handlers:
+            handler.removeFilter(logfilter)
@@ -1,5 +1,7 @@
-import re
-from typing import AnyStr, List, Pattern, Tuple
+from itertools import repeat
+from typing import AnyStr, Iterable, Iterator, List, Pattern, Tuple, Union
+
+from ..model.filesystem import RenameTemplate
 
 
 def has_indexes(content: str, start_string: str, end_string: str) -> bool:
@@ -32,10 +34,72 @@ def has_indexes(content: str, start_string: str, end_string: str) -> bool:
                 'Selam'                 \
             )
         False
+        >>> has_indexes('Selam (ben) YEmreAk', '(', ')')
+        True
 
     """
-    positions = position_index_from_string_index(content, start_string, end_string)
-    return bool(positions)
+    region = next(iter_regions(content, start_string, end_string), None)
+    return region is not None
+
+
+def iter_string_positions(content: str, string: str) -> Iterator[int]:
+    """Metnin içerisinde verilen metnin örtüşmeyen konumlarını sırayla döndürür
+    Aranan metin regex olarak değil, olduğu gibi aranır
+
+    Arguments:
+        content {str} -- Metin
+        string {str} -- Aranacak metin
+
+    Returns:
+        Iterator[int] -- Bulunan başlangıç konumları
+
+    Examples:
+        >>> list(iter_string_positions('aaaa.a', 'aa'))
+        [0, 2]
+        >>> list(iter_string_positions('a.b.c', '.'))
+        [1, 3]
+    """
+    step = len(string) or 1
+
+    position = content.find(string)
+    while position != -1:
+        yield position
+        position = content.find(string, position + step)
+
+
+def iter_regions(content: str, start_string: str, end_string: str) -> Iterator[Tuple[int, int]]:
+    """Başlangıç ve bitiş metinleri arasında kalan alanların konumlarını tek geçişte bulur
+
+    Başlangıç ve bitiş metinleri regex olarak değil, olduğu gibi aranır
+
+    Arguments:
+        content {str} -- İndekslerin aranacağı metin
+        start_string {str} -- Başlangıç indeksi
+        end_string {str} -- Bitiş indeksi
+
+    Returns:
+        Iterator[Tuple[int, int]] -- (başlangıç, bitiş) konumları
+
+    Examples:
+        >>> list(iter_regions('(*)A(/) (*)B(/)', '(*)', '(/)'))
+        [(3, 4), (11, 12)]
+    """
+    ends = iter_string_positions(content, end_string)
+    last_end = None
+
+    for start in iter_string_positions(content, start_string):
+        start += len(start_string)
+        if last_end is not None and start < last_end:
+            continue
+
+        for end in ends:
+            if start < end:
+                break
+        else:
+            return
+
+        yield start, end
+        last_end = end
 
 
 def position_index_from_string_index(
@@ -73,11 +137,7 @@ def position_index_from_string_index(
             )
         [(7, 16)]
     """
-    spos = [m.start() + len(start_string) for m in re.finditer(start_string, content)]
-    epos = [m.start() for m in re.finditer(end_string, content)]
-
-    positions = match_start_and_end_positions(spos, epos)
-    return positions
+    return list(iter_regions(content, start_string, end_string))
 
 
 def update_string_by_stringindexes(
@@ -119,13 +179,57 @@ def update_string_by_stringindexes(
                 'Merhaba'                   \
             )
         'MerhabaYPackageMerhaba'
+        >>> update_string_by_stringindexes( \
+                'YPackage',                 \
+                '<A>1<B> <A>22<B>',         \
+                '<A>',                      \
+                '<B>'                       \
+            )
+        '<A>YPackage<B> <A>YPackage<B>'
+    """
+
+    regions = iter_regions(content, start_string, end_string)
+    return update_string_by_regions(content, regions, string)
+
+
+def update_string_by_regions(
+    content: str,
+    regions: Iterable[Tuple[int, int]],
+    strings: Union[str, Iterable[str]]
+) -> str:
+    """Metnin içerisindeki birden fazla alanı tek seferde değiştirir
+
+    Tüm konumlar asıl metne göredir, yeni metin parçalar tek bir birleştirme ile oluşturulur
+
+    Arguments:
+        content {str} -- Asıl içerik
+        regions {Iterable[Tuple[int, int]]} -- Sıralı ve örtüşmeyen (başlangıç, bitiş) konumları
+        strings {Union[str, Iterable[str]]} -- Tüm alanlara yerleştirilecek metin veya her alan \
+            için sırasıyla yerleştirilecek metinler
+
+    Returns:
+        str -- Değiştirilmiş içerik
+
+    Examples:
+        >>> update_string_by_regions('Merhaba YEmreAk', [(0, 7), (8, 15)], ['Selam', 'YPackage'])
+        'Selam YPackage'
+        >>> update_string_by_regions('a-b-c', [(1, 2), (3, 4)], '+')
+        'a+b+c'
     """
+    if isinstance(strings, str):
+        strings = repeat(strings)
 
-    positions = position_index_from_string_index(content, start_string, end_string)
-    for start_pos, end_pos in positions:
-        content = update_string_by_indexes(string, content, start_pos, end_pos)
+    parts, last = [], 0
+    for (start_pos, end_pos), string in zip(regions, strings):
+        parts.append(content[last:start_pos])
+        parts.append(string)
+        last = end_pos
 
-    return content
+    if not parts:
+        return content
+
+    parts.append(content[last:])
+    return "".join(parts)
 
 
 def find_substrings_by_strings(
@@ -151,14 +255,10 @@ def find_substrings_by_strings(
         >>> find_substrings_by_strings('Sıkıcı _bir gün_ oldu', '_', '_')
         ['bir gün']
     """
-    substrings = []
-
-    positions = position_index_from_string_index(content, start_index, end_index)
-    for start_pos, end_pos in positions:
-        substring = find_substring(content, start_pos, end_pos)
-        substrings.append(substring)
-
-    return substrings
+    return [
+        find_substring(content, start_pos, end_pos)
+        for start_pos, end_pos in iter_regions(content, start_index, end_index)
+    ]
 
 
 def match_start_and_end_positions(spos: List[int], epos: List[int]) -> List[Tuple[int, int]]:
@@ -248,26 +348,29 @@ def find_substring(content: str, start_pos: int, end_pos: int) -> str:
     return new_content
 
 
-def rename_string(regex: Pattern[AnyStr], to: str, string: str) -> str:
+def rename_string(regex: Pattern[AnyStr], to: Union[str, RenameTemplate], string: str) -> str:
     """Metni yeniden adlandırma
 
+    Her eşleşme kendi gruplarıyla doldurulan şablon ile tek taramada değiştirilir. \
+        Çok sayıda metin için şablon `RenameTemplate.from_string` ile bir kez derlenmelidir.
+
     Arguments:
         regex {Pattern[AnyStr]} -- Aranan regex
-        to {str} -- Yeni isim
-        path {str} -- Yol
+        to {Union[str, RenameTemplate]} -- Yeni isim şablonu
+        string {str} -- Metin
 
     Returns:
-        bool -- Adlandırma yapıldıysa true
-    """
-    result = regex.search(string)
-    if result:
-        if result.lastindex:
-            for i in range(result.lastindex + 1):
-                to = to.replace(f"${i}", result[i])
+        str -- Yeni metin
 
-        string = regex.sub(to, string)
+    Examples:
+        >>> import re
+        >>> rename_string(re.compile("(re)(ad)"), "$2$1", "readme.md")
+        'adreme.md'
+    """
+    if not isinstance(to, RenameTemplate):
+        to = RenameTemplate.from_string(to, regex)
 
-    return string
+    return to.apply(string)
 
 
 def parse_to_lines(content: str) -> List[str]:
@@ -1,22 +1,57 @@
 import logging
 import re
+from base64 import b64encode
 from configparser import ConfigParser
+from contextlib import contextmanager
+from functools import partial
+from hashlib import sha1
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 from json import dumps as dumps_json
 from json import loads as loads_json
-from os import listdir as os_listdir
+from mmap import ACCESS_READ, mmap
+from os import O_CREAT, O_EXCL, O_RDONLY, O_WRONLY, DirEntry
+from os import chmod as os_chmod
+from os import close as os_close
+from os import fdopen as os_fdopen
+from os import fsync as os_fsync
+from os import open as os_open
 from os import rename as os_rename
-from os import walk as os_walk
-from os.path import join as os_path_join
+from os import scandir as os_scandir
+from os import replace as os_replace
+from os import unlink as os_unlink
+from os.path import realpath as os_path_realpath
+from os.path import samefile as os_path_samefile
 from pathlib import Path
+from secrets import token_hex
 from shutil import copyfile
-from typing import AnyStr, Dict, List, Pattern, Tuple
-from urllib.error import HTTPError
-from urllib.request import urlopen
+from tempfile import TMP_MAX
+from threading import Lock, local
+from typing import (TYPE_CHECKING, AnyStr, Callable, Dict, Iterable, Iterator,
+                    List, Match, Optional, Pattern, Set, TextIO, Tuple,
+                    Union)
+from urllib.parse import SplitResult, unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
 
-from . import common
+from ..model.filesystem import (IgnoreMatcher, Rename, RenamePlan,
+                                RenameTemplate)
+from . import background, common
+
+if TYPE_CHECKING:
+    from ..model.cache import HttpCache
 
 logger = logging.getLogger(__name__)
 
+# URL isteklerinde bağlantı ve okuma için beklenecek en uzun süre (saniye)
+URL_TIMEOUT = 30
+URL_MAX_REDIRECTS = 5
+
+# Her thread, her sunucu için tek bir bağlantıyı tekrar kullanır
+_connections = local()
+
+# `batched_writes` aktifken fsync işlemi bekleyen dizinler
+_pending_dirs: Optional[Set[Path]] = None
+_pending_dirs_lock = Lock()
+
 
 def must_exist(filepath: Path) -> bool:
     """Dosya sisteminde soyayı kontrol eder ve raporlar
@@ -59,6 +94,65 @@ def find_in_file(pattern: str, filepath: Path) -> List[str]:
     return re.findall(pattern, content)
 
 
+@contextmanager
+def map_file(filepath: Path) -> Iterator[Union[mmap, bytes]]:
+    """Dosyayı salt okunur olarak belleğe eşler (mmap)
+
+    Boş dosyalar eşlenemediğinden `b''` verilir
+
+    Arguments:
+        filepath {Path} -- Dosya yolu objesi
+
+    Returns:
+        Iterator[Union[mmap, bytes]] -- Dosyanın bayt içeriği
+    """
+    with filepath.open("rb") as file:
+        if not filepath.stat().st_size:
+            yield b""
+            return
+
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _decode_match(match: Match[bytes]) -> Union[str, Tuple[str, ...]]:
+    groups = match.groups()
+    if not groups:
+        return match.group().decode("utf-8", errors="ignore")
+
+    decoded = tuple(group.decode("utf-8", errors="ignore") if group is not None else "" for group in groups)
+    return decoded[0] if len(decoded) == 1 else decoded
+
+
+def find_in_mapped_file(pattern: Union[str, bytes], filepath: Path) -> List[str]:
+    """Dosya içeriğinde pattern arama, dosyanın tamamını okumadan
+
+    Arama bayt seviyesinde yapılır, sadece eşleşen kısımlar metne çevrilir. \
+        Çok büyük dosyalar için `find_in_file` yerine kullanılmalıdır.
+    `str` pattern 'utf-8' ile bayta çevrilir; `.` ve `\\w` gibi ifadeler \
+        karakter yerine bayt ile eşleşir.
+
+    Arguments:
+        pattern {Union[str, bytes]} -- Aranacak metin veya regex patterni
+        filepath {Path} -- Dosya yolu objesi
+
+    Returns:
+        List[str] -- Sonuçlar, `re.findall` ile aynı yapıda
+
+    Examples:
+        >>> find_in_mapped_file(rb'# (\\S+) YP', Path('docs/README.md'))
+        ['📦']
+
+        >>> find_in_mapped_file('# (\\S+) (.)(.)ack', Path('docs/README.md'))
+        [('📦', 'Y', 'P')]
+    """
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+
+    with map_file(filepath) as content:
+        return [_decode_match(match) for match in re.finditer(pattern, content)]
+
+
 def find_level(filepath: Path, root: Path) -> int:
     """Dizin seviyesini bulma
 
@@ -98,6 +192,41 @@ def read_file(filepath: Path) -> str:
     return content
 
 
+def iter_lines(filepath: Path, limit: Optional[int] = None) -> Iterator[str]:
+    """Dosyayı satır satır okur, tamamını belleğe almaz.
+    Dosya bulunamazsa ekrana raporlar hata fırlatmaz
+
+    Arguments:
+        filepath {Path} -- Okunacak dosyanın yolu
+
+    Keyword Arguments:
+        limit {Optional[int]} -- Okunacak en fazla bayt sayısı, `None` ise sınırsız \
+            (default: {None})
+
+    Returns:
+        Iterator[str] -- Okunan satırlar
+
+    Examples:
+        >>> next(iter_lines(Path('docs/README.md')))
+        '---\\n'
+        >>> list(iter_lines(Path('docs/README.md'), limit=6))
+        ['---\\n', 'de']
+    """
+    try:
+        logger.debug(f"Dosya satır satır okunuyor: {filepath}")
+        with filepath.open("rb") as file:
+            size = 0
+            while limit is None or size < limit:
+                line = file.readline(-1 if limit is None else limit - size)
+                if not line:
+                    break
+
+                size += len(line)
+                yield line.decode("utf-8", errors="ignore")
+    except Exception:
+        logger.debug(f"Dosya okunamadı: {filepath}")
+
+
 def read_json(filepath: Path, strict=False) -> dict:
     """Dosya içerisindeki JSON metnini okur.
     Dosya bulunamazsa ekrana raporlar hata fırlatmaz
@@ -138,29 +267,191 @@ def read_part_of_file(filepath: Path, index: str) -> str:
     Returns:
             str -- Okunan veri
     """
-    filestr = ""
+    lines = []
     with filepath.open("r", encoding="utf-8") as file:
         read = False
         for line in file:
-            if index in line.replace(" ", ""):
+            if index[:1] in line and index in line.replace(" ", ""):
                 read = not read
                 continue
 
             if read:
-                filestr += line
+                lines.append(line)
 
         logger.info(f"{filepath} dosyasının {index} alanı okundu")
-    return filestr
+    return "".join(lines)
+
+
+def read_part_of_mapped_file(filepath: Path, index: str) -> str:
+    """Doysanın verilen indeksler arasında kalan kısmını, dosyanın tamamını okumadan okuma
+
+    İndeks bayt seviyesinde aranır, sadece indeksler arasındaki kısımlar metne çevrilir. \
+        `read_part_of_file` gibi indeksin bulunduğu satırdaki boşluklar dikkate alınmaz.
+
+    Arguments:
+            filepath {Path} -- Dosya yolu objesi
+            index {str} -- İndeks
+
+    Returns:
+            str -- Okunan veri
+    """
+    pattern = b" *".join(re.escape(bytes([byte])) for byte in index.encode("utf-8"))
+
+    parts = []
+    with map_file(filepath) as content:
+        start, linestart = None, -1
+        for match in re.finditer(pattern, content):
+            previous_linestart = linestart
+            linestart = content.rfind(b"\n", 0, match.start()) + 1
+            if linestart == previous_linestart:
+                continue
+
+            if start is None:
+                lineend = content.find(b"\n", match.end())
+                start = len(content) if lineend == -1 else lineend + 1
+            else:
+                parts.append(content[start:linestart])
+                start = None
+
+        if start is not None:
+            parts.append(content[start:])
+
+    logger.info(f"{filepath} dosyasının {index} alanı okundu")
+    return b"".join(parts).decode("utf-8", errors="ignore").replace("\r\n", "\n")
+
+
+def _proxy_for(scheme: str, host: str) -> Optional[SplitResult]:
+    """`urlopen` gibi `HTTP_PROXY`, `HTTPS_PROXY` ve `NO_PROXY` ortam değişkenlerini dikkate alır
+
+    Arguments:
+        scheme {str} -- İstek şeması (https, http)
+        host {str} -- İstek yapılacak sunucu
+
+    Returns:
+        Optional[SplitResult] -- Kullanılacak vekil sunucu, yoksa `None`
+    """
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(host):
+        return None
+
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    return urlsplit(proxy)
+
+
+def _proxy_headers(proxy: SplitResult) -> Dict[str, str]:
+    if not proxy.username:
+        return {}
+
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + b64encode(credentials.encode("utf-8")).decode("ascii")}
+
+
+def _connection_for(
+    scheme: str,
+    netloc: str,
+    timeout: float,
+    proxy: Optional[SplitResult] = None
+) -> HTTPConnection:
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+
+    key = (scheme, netloc, proxy.netloc if proxy else None)
+    connection = pool.get(key)
+    if connection is None:
+        if proxy is None:
+            connection_class = HTTPSConnection if scheme == "https" else HTTPConnection
+            connection = connection_class(netloc, timeout=timeout)
+        elif scheme == "https":
+            # HTTPS istekleri vekil sunucu üzerinden CONNECT tüneli ile iletilir
+            connection = HTTPSConnection(proxy.hostname, proxy.port, timeout=timeout)
+            connection.set_tunnel(netloc, headers=_proxy_headers(proxy))
+        else:
+            connection = HTTPConnection(proxy.hostname, proxy.port, timeout=timeout)
 
+        pool[key] = connection
 
-def read_file_from_url(url: str, encoding="utf-8") -> str:
+    return connection
+
+
+def request_url(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = URL_TIMEOUT
+) -> Tuple[int, Dict[str, str], bytes]:
+    """URL'e GET isteği gönderir, yönlendirmeleri takip eder
+
+    Aynı thread içerisinde aynı sunucuya yapılan istekler tek bağlantıyı kullanır. \
+        `urlopen` gibi ortam değişkenlerinde tanımlı vekil sunucular kullanılır.
+
+    Arguments:
+        url {str} -- URL (https, http)
+
+    Keyword Arguments:
+        headers {Optional[Dict[str, str]]} -- İstek başlıkları (default: {None})
+        timeout {float} -- Bağlantı ve okuma için zaman aşımı (default: {URL_TIMEOUT})
+
+    Returns:
+        Tuple[int, Dict[str, str], bytes] -- Durum kodu, yanıt başlıkları ve içerik
+    """
+    for _ in range(URL_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        request_headers = dict(headers or {})
+        proxy = _proxy_for(parts.scheme, parts.hostname or "")
+        if proxy and parts.scheme != "https":
+            # Vekil sunucuya gönderilen HTTP isteklerinde tam URL kullanılır
+            path = parts._replace(fragment="").geturl()
+            request_headers.update(_proxy_headers(proxy))
+
+        for retry in (False, True):
+            connection = _connection_for(parts.scheme, parts.netloc, timeout, proxy=proxy)
+            try:
+                connection.request("GET", path, headers=request_headers)
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (HTTPException, ConnectionError):
+                # Sunucu boşta kalan bağlantıyı kapatmış olabilir, bir kez yeniden denenir
+                connection.close()
+                if retry:
+                    raise
+            except OSError:
+                connection.close()
+                raise
+
+        response_headers = {key.lower(): value for key, value in response.getheaders()}
+        if response.status in (301, 302, 303, 307, 308) and "location" in response_headers:
+            url = urljoin(url, response_headers["location"])
+            continue
+
+        return response.status, response_headers, body
+
+    raise HTTPException(f"Çok fazla yönlendirme: {url}")
+
+
+def read_file_from_url(
+    url: str,
+    encoding="utf-8",
+    timeout: float = URL_TIMEOUT,
+    cache: Optional["HttpCache"] = None
+) -> str:
     """URL ile dosya okuma
 
+    Önbellek verilirse koşullu istek gönderilir, dosya değişmediyse (304) önbellekteki \
+        içerik döndürülür
+
     Arguments:
         rawUrl {str} -- URL (https, http)
 
     Keyword Arguments:
         encoding {str} -- Dosya kodlanması (default: {"utf-8"})
+        timeout {float} -- Bağlantı ve okuma için zaman aşımı (default: {URL_TIMEOUT})
+        cache {Optional[HttpCache]} -- ETag / Last-Modified önbelleği (default: {None})
 
     Returns:
         str -- Okunan metin
@@ -168,30 +459,233 @@ def read_file_from_url(url: str, encoding="utf-8") -> str:
 
     content = ""
     try:
-        file = urlopen(url)
-        content = file.read()
-        content = content.decode(encoding)
-        file.close()
-        logger.debug(f"URL üzerinden dosya okundu: {url}")
-    except HTTPError as error:
-        logger.error(
-            f"Dosya okunamadı: {error.url} <HTTPError {error.code}: {error.msg}>")
+        headers = cache.get_headers(url) if cache else {}
+        status, response_headers, body = request_url(url, headers=headers, timeout=timeout)
+        if status == 304 and cache:
+            content = cache.get(url) or ""
+            logger.debug(f"URL üzerindeki dosya değişmemiş, önbellekten okundu: {url}")
+        elif status >= 400:
+            logger.error(f"Dosya okunamadı: {url} <HTTPError {status}>")
+        else:
+            content = body.decode(encoding)
+            logger.debug(f"URL üzerinden dosya okundu: {url}")
+
+            if cache:
+                cache.set(url, response_headers, content)
+    except (OSError, HTTPException) as error:
+        logger.error(f"Dosya okunamadı: {url} <{type(error).__name__}: {error}>")
 
     return content
 
 
+def read_files_from_urls(
+    urls: List[str],
+    encoding="utf-8",
+    timeout: float = URL_TIMEOUT,
+    jobs: int = 1,
+    cache: Optional["HttpCache"] = None
+) -> List[str]:
+    """URL'lerdeki dosyaları `jobs` kadar eş zamanlı istek ile okur
+
+    Arguments:
+        urls {List[str]} -- URL listesi (https, http)
+
+    Keyword Arguments:
+        encoding {str} -- Dosya kodlanması (default: {"utf-8"})
+        timeout {float} -- Her istek için zaman aşımı (default: {URL_TIMEOUT})
+        jobs {int} -- En fazla eş zamanlı istek sayısı (default: {1})
+        cache {Optional[HttpCache]} -- ETag / Last-Modified önbelleği (default: {None})
+
+    Returns:
+        List[str] -- URL sırasına göre okunan metinler, okunamayanlar için ''
+    """
+    return background.map_in_order(
+        lambda url: read_file_from_url(url, encoding=encoding, timeout=timeout, cache=cache),
+        urls,
+        jobs=jobs
+    )
+
+
+def fsync_dir(dirpath: Path):
+    """Dizin kaydını diske işler, desteklenmeyen sistemlerde bir şey yapmaz
+
+    Arguments:
+        dirpath {Path} -- Dizin yolu
+    """
+    try:
+        fd = os_open(dirpath, O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os_fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os_close(fd)
+
+
+def commit_pending_writes() -> int:
+    """`batched_writes` ile bekletilen dizin kayıtlarını diske işler
+
+    Dosya içerikleri yazılırken diske işlendiğinden sadece dizinler, \
+        her biri bir kez fsync edilir
+
+    Returns:
+        int -- Diske işlenen dizin sayısı
+    """
+    global _pending_dirs
+
+    with _pending_dirs_lock:
+        dirpaths = _pending_dirs or set()
+        if _pending_dirs is not None:
+            _pending_dirs = set()
+
+    for dirpath in dirpaths:
+        fsync_dir(dirpath)
+
+    if dirpaths:
+        logger.debug(f"{len(dirpaths)} dizin diske işlendi")
+    return len(dirpaths)
+
+
+@contextmanager
+def batched_writes():
+    """Blok içindeki `write_to_file` işlemlerinin dizin fsync adımını blok sonuna erteler
+
+    Dosyalar yine atomik olarak değiştirilir ve hemen okunabilir; blok sonunda \
+        her dizin yalnızca bir kez diske işlenir. İç içe kullanıldığında \
+        diske işleme en dıştaki blokta yapılır.
+
+    Examples:
+        >>> with batched_writes():
+        ...     write_to_file(Path('temp_batched.md'), 'Selam')
+        True
+        >>> Path('temp_batched.md').read_text()
+        'Selam'
+        >>> Path('temp_batched.md').unlink()
+    """
+    global _pending_dirs
+
+    with _pending_dirs_lock:
+        outermost = _pending_dirs is None
+        if outermost:
+            _pending_dirs = set()
+
+    try:
+        yield
+    finally:
+        if outermost:
+            commit_pending_writes()
+            with _pending_dirs_lock:
+                _pending_dirs = None
+
+
+def file_digest(filepath: Path, chunk_size: int = 64 * 1024) -> Optional[str]:
+    """Dosyanın sha1 özetini, dosyayı parça parça okuyarak hesaplar
+
+    Arguments:
+        filepath {Path} -- Dosya yolu
+
+    Keyword Arguments:
+        chunk_size {int} -- Tek seferde okunacak bayt sayısı (default: {64 * 1024})
+
+    Returns:
+        Optional[str] -- Özet, dosya okunamazsa `None`
+
+    Examples:
+        >>> file_digest(Path('yok.md')) is None
+        True
+    """
+    digest = sha1()
+    try:
+        with filepath.open("rb") as file:
+            for chunk in iter(lambda: file.read(chunk_size), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+
+    return digest.hexdigest()
+
+
+def _create_tempfile(filepath: Path) -> Tuple[int, Path]:
+    # `mkstemp` dosyayı 0o600 ile oluşturur; 0o666 verildiğinde izinler,
+    # `Path.write_text` ile oluşturulan dosyalardaki gibi umask'a göre belirlenir
+    for _ in range(TMP_MAX):
+        temppath = filepath.parent / f".{filepath.name}.{token_hex(4)}.tmp"
+        try:
+            return os_open(temppath, O_WRONLY | O_CREAT | O_EXCL, 0o666), temppath
+        except FileExistsError:
+            continue
+
+    raise FileExistsError(f"Geçici dosya oluşturulamadı: {filepath}")
+
+
+def _write_chunks_atomically(filepath: Path, chunks: Iterable[str], skip_unchanged=False) -> bool:
+    # Sembolik bağlantının kendisi yerine gösterdiği dosya değiştirilmeli
+    filepath = Path(os_path_realpath(filepath))
+
+    try:
+        mode = filepath.stat().st_mode & 0o7777
+    except OSError:
+        mode = None
+
+    temppath = None
+    try:
+        fd, temppath = _create_tempfile(filepath)
+        with os_fdopen(fd, "w", encoding="utf-8") as file:
+            digest = sha1()
+            for chunk in chunks:
+                file.write(chunk)
+                if skip_unchanged:
+                    digest.update(chunk.encode("utf-8"))
+
+            if skip_unchanged and digest.hexdigest() == file_digest(filepath):
+                return False
+
+            # İçerik yer değiştirmeden önce diske işlenmeli, aksi halde çökme sonrası dosya boş kalabilir
+            file.flush()
+            os_fsync(file.fileno())
+
+        if mode is not None:
+            os_chmod(temppath, mode)
+        os_replace(temppath, filepath)
+        temppath = None
+
+        with _pending_dirs_lock:
+            pending = _pending_dirs is not None
+            if pending:
+                _pending_dirs.add(filepath.parent)
+
+        if not pending:
+            fsync_dir(filepath.parent)
+
+        return True
+    finally:
+        if temppath:
+            try:
+                os_unlink(temppath)
+            except OSError:
+                pass
+
+
 def write_to_file(filepath: Path, content: str) -> bool:
-    """Dosyaya 'utf-8' metni yazar.
-    Dosya bulunamazsa ekrana raporlar hata fırlatmaz
+    """Dosyaya 'utf-8' metni atomik olarak yazar.
+    Dosya yazılamazsa ekrana raporlar hata fırlatmaz
+
+    İçerik aynı dizindeki geçici bir dosyaya yazılıp fsync edilir ve `os.replace` ile \
+        hedefin yerine koyulur, yarım kalan yazma işlemi dosyayı bozmaz.
+    `batched_writes` aktifse dizinin fsync adımı blok sonuna ertelenir
 
     Arguments:
-        filepath {Path} -- Okunacak dosyanın yolu
+        filepath {Path} -- Yazılacak dosyanın yolu
+        content {str} -- Yazılacak metin
 
     Returns:
         bool -- Yazma işlemi başarılı ise `True`
     """
     try:
-        filepath.write_text(content, encoding="utf-8")
+        _write_chunks_atomically(filepath, [content])
         logger.info(f"Dosya güncellendi: {filepath}")
         return True
     except Exception:
@@ -199,6 +693,33 @@ def write_to_file(filepath: Path, content: str) -> bool:
         return False
 
 
+def write_chunks_to_file(filepath: Path, chunks: Iterable[str]) -> bool:
+    """Parça parça üretilen metni, tamamını belleğe almadan dosyaya atomik olarak yazar.
+    Dosya yazılamazsa ekrana raporlar hata fırlatmaz
+
+    Parçalar geçici dosyaya yazılırken özetleri hesaplanır; sonuç mevcut \
+        dosyanın özeti ile aynıysa dosyaya dokunulmaz.
+
+    Arguments:
+        filepath {Path} -- Yazılacak dosyanın yolu
+        chunks {Iterable[str]} -- Sırayla yazılacak metin parçaları
+
+    Returns:
+        bool -- Dosya değiştiyse `True`
+    """
+    try:
+        changed = _write_chunks_atomically(filepath, chunks, skip_unchanged=True)
+    except Exception:
+        logger.exception(f"Dosyaya yazılamadı: {filepath}")
+        return False
+
+    if changed:
+        logger.info(f"Dosya güncellendi: {filepath}")
+    else:
+        logger.debug(f"Dosya değişmedi: {filepath}")
+    return changed
+
+
 def write_json_to_file(filepath: Path, jsonstr: Dict[str, str], indent: int = 4, eof_line=True):
     """Dosyaya JSON yazar.
     Dosya bulunamazsa ekrana raporlar hata fırlatmaz
@@ -233,6 +754,27 @@ def has_indexes(filepath: Path, start_string: str, end_string: str) -> bool:
     return result
 
 
+def update_file(filepath: Path, transform: Callable[[str], str]) -> bool:
+    """Dosyayı bir kez okur, verilen fonksiyon ile dönüştürür ve sadece içerik
+    değiştiyse yazar
+
+    Arguments:
+        filepath {Path} -- Dosya yolu objesi
+        transform {Callable[[str], str]} -- Dosya içeriğini alıp yeni içeriği döndüren fonksiyon
+
+    Returns:
+        bool -- Dosyada değişiklik olduysa True
+    """
+    content = read_file(filepath)
+    new_content = transform(content)
+
+    if new_content == content:
+        logger.debug(f"Dosyada değişiklik yok: {filepath}")
+        return False
+
+    return write_to_file(filepath, new_content)
+
+
 def update_file_by_stringindexes(
     string: str,
     filepath: Path,
@@ -255,25 +797,21 @@ def update_file_by_stringindexes(
         bool -- Dosyada değişiklik olduysa True
     """
 
-    content = read_file(filepath)
-    new_content = common.update_string_by_stringindexes(
-        string,
-        content,
-        start_string,
-        end_string
-    )
+    def transform(content: str) -> str:
+        new_content = common.update_string_by_stringindexes(
+            string,
+            content,
+            start_string,
+            end_string
+        )
 
-    if new_content == content:
-        insert_conditions = must_inserted
-        insert_conditions &= not has_indexes(
-            filepath, start_string, end_string)
-        if insert_conditions:
+        insert_conditions = new_content == content and must_inserted
+        if insert_conditions and not common.has_indexes(content, start_string, end_string):
             new_content += start_string + string + end_string
-            return write_to_file(filepath, new_content)
 
-        return False
+        return new_content
 
-    return write_to_file(filepath, new_content)
+    return update_file(filepath, transform)
 
 
 def copy_file(src: Path, dst: Path) -> bool:
@@ -312,66 +850,380 @@ def rename(regex: Pattern[AnyStr], to: str, path: str) -> bool:
     return False
 
 
-def rename_folders(
-        startpath: str, pattern_string: str, to: str,
-        ignore_case=True, recursive=False
+def compile_rename_pattern(pattern_string: str, ignore_case=True) -> Pattern[str]:
+    return re.compile(pattern_string, re.IGNORECASE if ignore_case else 0)
+
+
+def iter_rename_candidates(
+        startpath: Path, dir_mode=False, recursive=False, ignore: Optional[IgnoreMatcher] = None
+) -> Iterator[Path]:
+    """Adlandırılacak dosya veya dizinleri her dizini bir kez listeleyerek bulur
+
+    Sembolik bağlantı olan dizinlerin ve filtreye uyan dizinlerin içerisine girilmez
+
+    Arguments:
+        startpath {Path} -- Başlangıç dizini
+
+    Keyword Arguments:
+        dir_mode {bool} -- Dosyalar yerine dizinleri verir (default: {False})
+        recursive {bool} -- Alt dizinlere de iner (default: {False})
+        ignore {Optional[IgnoreMatcher]} -- Atlanacak yolların filtresi (default: {None})
+
+    Returns:
+        Iterator[Path] -- Dosya veya dizin yolları
+    """
+    ignore = ignore if ignore else IgnoreMatcher()
+
+    dirpaths = [(startpath, "", ignore)]
+    while dirpaths:
+        dirpath, relpath, matcher = dirpaths.pop()
+        with os_scandir(dirpath) as iterator:
+            entries = list(iterator)
+
+        if relpath and any(entry.name in matcher.filenames for entry in entries):
+            matcher = matcher.child(dirpath, relpath)
+
+        prefix = relpath + "/" if relpath else ""
+        for entry in entries:
+            path = dirpath / entry.name
+            is_dir = entry.is_dir()
+            if matcher.is_ignored(prefix + entry.name, is_dir=is_dir):
+                continue
+
+            if is_dir:
+                if recursive and not entry.is_symlink():
+                    dirpaths.append((path, prefix + entry.name, matcher))
+                if dir_mode:
+                    yield path
+            elif not dir_mode:
+                yield path
+
+
+def _order_renames_in_dir(renames: Dict[str, str], dirpath: Path) -> List[Rename]:
+    """Aynı dizindeki adlandırmaları, hedefi başka bir adımın kaynağı olanlar \
+        önce uygulanacak şekilde sıralar; döngüleri geçici bir isimle çözer
+    """
+    sources = set(renames)
+    targets = set(renames.values())
+
+    ordered = []
+    visited = set()
+
+    def emit_chain(name: str):
+        chain = []
+        while name in renames and name not in visited:
+            visited.add(name)
+            chain.append(name)
+            name = renames[name]
+
+        for name in reversed(chain):
+            ordered.append(Rename(dirpath / name, dirpath / renames[name]))
+
+    for name in sorted(sources - targets):
+        emit_chain(name)
+
+    for name in sorted(sources - visited):
+        if name in visited:
+            continue
+
+        # Döngü: ilk kaynak geçici isme alınır, kalan zincir tersten uygulanır
+        temp_name = f".{name}.yfilerenamer"
+        ordered.append(Rename(dirpath / name, dirpath / temp_name))
+        visited.add(name)
+
+        chain = []
+        current = renames[name]
+        while current != name:
+            visited.add(current)
+            chain.append(current)
+            current = renames[current]
+
+        for source in reversed(chain):
+            ordered.append(Rename(dirpath / source, dirpath / renames[source]))
+        ordered.append(Rename(dirpath / temp_name, dirpath / renames[name]))
+
+    return ordered
+
+
+def plan_renames(
+        startpath: Path, pattern_string: str, to: str,
+        ignore_case=True, recursive=False, dir_mode=False, ignore: Optional[IgnoreMatcher] = None
+) -> RenamePlan:
+    """Dosya sisteminde değişiklik yapmadan yeniden adlandırma planı oluşturur
+
+    Şablon sadece dosya veya dizin ismine uygulanır. Aynı hedefe giden \
+        adımlar, var olan bir yolun üzerine yazılması ve geçersiz isimler \
+        çakışma olarak raporlanır. Zincirleme ve döngüsel adlandırmalar sıralanır.
+
+    Arguments:
+        startpath {Path} -- Başlangıç dizini
+        pattern_string {str} -- Aranan regex
+        to {str} -- Yeni isim şablonu
+
+    Keyword Arguments:
+        ignore_case {bool} -- Büyük küçük harf duyarsız arama (default: {True})
+        recursive {bool} -- Alt dizinlere de iner (default: {False})
+        dir_mode {bool} -- Dosyalar yerine dizinleri adlandırır (default: {False})
+        ignore {Optional[IgnoreMatcher]} -- Atlanacak yolların filtresi (default: {None})
+
+    Returns:
+        RenamePlan -- Uygulama sırasına dizilmiş plan
+    """
+    startpath = Path(startpath)
+    pattern = compile_rename_pattern(pattern_string, ignore_case=ignore_case)
+    template = RenameTemplate.from_string(to, pattern)
+
+    conflicts = []
+    groups: Dict[Path, Dict[str, str]] = {}
+    for path in iter_rename_candidates(startpath, dir_mode=dir_mode, recursive=recursive, ignore=ignore):
+        name = path.name
+        new_name = template.apply(name)
+        if new_name == name:
+            continue
+
+        if not new_name or new_name in (".", "..") or "/" in new_name or "\\" in new_name:
+            conflicts.append(f"Geçersiz isim: {path} -> {new_name!r}")
+            continue
+
+        groups.setdefault(path.parent, {})[name] = new_name
+
+    renames = []
+    # Alt dizinler üst dizinlerden önce adlandırılır
+    for dirpath in sorted(groups, key=lambda dirpath: len(dirpath.parts), reverse=True):
+        group = groups[dirpath]
+
+        owners: Dict[str, str] = {}
+        for name, new_name in sorted(group.items()):
+            target = dirpath / new_name
+            if new_name in owners:
+                conflicts.append(f"Aynı hedef: {dirpath / owners[new_name]}, {dirpath / name} -> {target}")
+            elif new_name not in group and target.exists() and not os_path_samefile(dirpath / name, target):
+                conflicts.append(f"Hedef zaten var: {dirpath / name} -> {target}")
+            else:
+                owners[new_name] = name
+
+        renames += _order_renames_in_dir({name: new_name for new_name, name in owners.items()}, dirpath)
+
+    return RenamePlan(renames, conflicts)
+
+
+def group_renames(renames: List[Rename]) -> List[List[List[Rename]]]:
+    """Sıralı adlandırmaları paralel uygulanabilecek gruplara ayırır
+
+    Aynı derinlikteki ardışık adımlar bir seviye oluşturur; seviye içerisinde \
+        her dizinin adımları sırasını koruyarak ayrı bir bölüme alınır. \
+        Farklı dizinlerin bölümleri birbirini etkilemediğinden aynı anda uygulanabilir.
+
+    Arguments:
+        renames {List[Rename]} -- Uygulama sırasındaki adımlar
+
+    Returns:
+        List[List[List[Rename]]] -- Seviyeler, seviyelerdeki dizin bölümleri
+
+    Examples:
+        >>> levels = group_renames([
+        ...     Rename(Path('a/b/1'), Path('a/b/2')),
+        ...     Rename(Path('a/c/1'), Path('a/c/2')),
+        ...     Rename(Path('a/b'), Path('a/d'))
+        ... ])
+        >>> [[len(partition) for partition in level] for level in levels]
+        [[1, 1], [1]]
+    """
+    levels = []
+    depth = None
+    for rename in renames:
+        if len(rename.source.parts) != depth:
+            depth = len(rename.source.parts)
+            levels.append({})
+
+        levels[-1].setdefault(rename.source.parent, []).append(rename)
+
+    return [list(level.values()) for level in levels]
+
+
+def read_rename_journal(filepath: Path) -> List[Rename]:
+    """Adlandırma günlüğündeki adımları uygulandıkları sırayla okur
+
+    Yarım yazılmış son satır atlanır
+
+    Arguments:
+        filepath {Path} -- Günlük dosyası
+
+    Returns:
+        List[Rename] -- Uygulanmış adımlar
+    """
+    renames = []
+    for line in iter_lines(filepath):
+        try:
+            entry = loads_json(line)
+            renames.append(Rename(Path(entry["source"]), Path(entry["target"])))
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Günlük satırı okunamadı: {line.strip()}")
+
+    return renames
+
+
+def _write_rename_to_journal(journal_file: TextIO, journal_lock: Lock, rename: Rename):
+    # `ensure_ascii` ile utf-8 olmayan dosya isimleri (surrogateescape) de kayıpsız yazılır
+    entry = dumps_json({
+        "source": str(rename.source.absolute()),
+        "target": str(rename.target.absolute())
+    })
+    with journal_lock:
+        journal_file.write(entry + "\n")
+        journal_file.flush()
+
+
+def _execute_renames(
+    renames: List[Rename],
+    journal_file: Optional[TextIO] = None,
+    journal_lock: Optional[Lock] = None
 ) -> bool:
+    for rename in renames:
+        try:
+            os_rename(rename.source, rename.target)
+        except OSError:
+            logger.exception(f"{rename.source} -> {rename.target} taşınamadı")
+            return False
+
+        logger.info(f"{rename.source} -> {rename.target} taşındı")
+
+        if journal_file:
+            try:
+                _write_rename_to_journal(journal_file, journal_lock, rename)
+            except (OSError, ValueError):
+                logger.exception(f"{rename.source} -> {rename.target} günlüğe yazılamadı")
+                return False
 
-    pattern: Pattern[AnyStr]
-    if ignore_case:
-        pattern = re.compile(pattern_string, re.IGNORECASE)
-    else:
-        pattern = re.compile(pattern_string)
+    return True
 
-    changed_happend = False
 
-    if recursive:
-        for root, dirs, _ in os_walk(startpath):
-            result = rename(pattern, to, root)
+def execute_rename_plan(plan: RenamePlan, jobs: int = 1, journal: Optional[Path] = None) -> bool:
+    """Yeniden adlandırma planını uygular
 
-            if not changed_happend and result:
-                changed_happend = True
-    else:
-        for path in os_listdir(startpath):
-            if Path(path).is_dir():
-                result = rename(pattern, to, path)
+    Çakışması olan planlar uygulanmaz. Seviyeler sırayla, seviyedeki dizin \
+        bölümleri `jobs` kadar thread ile paralel uygulanır. Bir adım başarısız \
+        olursa sonraki seviyelere geçilmez.
 
-                if not changed_happend and result:
-                    changed_happend = True
+    Arguments:
+        plan {RenamePlan} -- Uygulanacak plan
+
+    Keyword Arguments:
+        jobs {int} -- Thread sayısı (default: {1})
+        journal {Optional[Path]} -- Uygulanan her adımın eklendiği günlük dosyası, \
+            `undo_rename_journal` ile geri alınabilir (default: {None})
+
+    Returns:
+        bool -- Adlandırma yapıldıysa ve tüm adımlar başarılıysa true
+    """
+    if not plan.is_valid():
+        for conflict in plan.conflicts:
+            logger.error(f"Çakışma: {conflict}")
+        return False
+
+    journal_file = journal.open("a", encoding="utf-8") if journal else None
+    execute_partition = partial(_execute_renames, journal_file=journal_file, journal_lock=Lock())
+
+    try:
+        for level in group_renames(plan.renames):
+            if not all(background.map_in_order(execute_partition, level, jobs=jobs)):
+                return False
+    finally:
+        if journal_file:
+            journal_file.close()
+            logger.info(f"Adlandırma günlüğü: {journal}")
 
-    return changed_happend
+    return bool(plan.renames)
+
+
+def undo_rename_journal(journal: Path, jobs: int = 1) -> bool:
+    """Günlükteki adlandırmaları ters sırayla geri alır
+
+    Arguments:
+        journal {Path} -- `execute_rename_plan` ile yazılan günlük dosyası
+
+    Keyword Arguments:
+        jobs {int} -- Thread sayısı (default: {1})
+
+    Returns:
+        bool -- Geri alma yapıldıysa ve tüm adımlar başarılıysa true
+    """
+    if not must_exist(journal):
+        return False
+
+    renames = [Rename(rename.target, rename.source) for rename in reversed(read_rename_journal(journal))]
+    return execute_rename_plan(RenamePlan(renames), jobs=jobs)
+
+
+def rename_folders(
+        startpath: str, pattern_string: str, to: str,
+        ignore_case=True, recursive=False
+) -> bool:
+    plan = plan_renames(
+        startpath, pattern_string, to,
+        ignore_case=ignore_case, recursive=recursive, dir_mode=True
+    )
+    return execute_rename_plan(plan)
 
 
 def rename_files(
         startpath: str, pattern_string: str, to: str,
         ignore_case=True, recursive=False
 ) -> bool:
+    plan = plan_renames(
+        startpath, pattern_string, to,
+        ignore_case=ignore_case, recursive=recursive
+    )
+    return execute_rename_plan(plan)
 
-    pattern: Pattern[AnyStr]
-    if ignore_case:
-        pattern = re.compile(pattern_string, re.IGNORECASE)
-    else:
-        pattern = re.compile(pattern_string)
 
-    changed_happend = False
+def iter_dir_entries(
+        root: Path, ignore: Iterable[str] = (), include_hidden=False, sort=False
+) -> Iterator[DirEntry]:
+    """Dizindeki girdileri `os.scandir` ile tek tek verir
 
-    if recursive:
-        for root, dirs, files in os_walk(startpath):
-            for f in files:
-                path = os_path_join(root, f)
-                result = rename(pattern, to, path)
+    Filtreleme listeleme sırasında yapılır, girdilerin tür bilgisi `DirEntry` \
+        üzerinde saklandığından `is_dir` / `is_file` çoğu sistemde ek stat yapmaz. \
+        Sıralama istenmezse girdiler belleğe alınmadan verilir.
 
-                if result:
-                    changed_happend = True
-    else:
-        for path in os_listdir(startpath):
-            if Path(path).is_file():
-                result = rename(pattern, to, path)
+    Arguments:
+        root {Path} -- Listenelecek dizin
+
+    Keyword Arguments:
+        ignore {Iterable[str]} -- Atlanılacak isimler (default: {()})
+        include_hidden {bool} -- Gizli dosyaları dahil etme (default: {False})
+        sort {bool} -- İsme göre sıralı verme (default: {False})
+
+    Returns:
+        Iterator[DirEntry] -- Dizin girdileri
+
+    Examples:
+        >>> [entry.name for entry in iter_dir_entries(Path("docs"), sort=True)][:2]
+        ['CHANGELOG.md', 'CONTRIBUTING.md']
+    """
+    ignore = ignore if isinstance(ignore, (set, frozenset)) else set(ignore)
+
+    with os_scandir(root) as entries:
+        entries = (
+            entry for entry in entries
+            if (include_hidden or not entry.name.startswith(".")) and entry.name not in ignore
+        )
+        if sort:
+            entries = sorted(entries, key=lambda entry: entry.name)
+
+        yield from entries
 
-                if result:
-                    changed_happend = True
 
-    return changed_happend
+def iter_dirs(root: Path, ignore: Iterable[str] = (), include_hidden=False, sort=False) -> Iterator[Path]:
+    for entry in iter_dir_entries(root, ignore=ignore, include_hidden=include_hidden, sort=sort):
+        if entry.is_dir():
+            yield root / entry.name
+
+
+def iter_files(root: Path, ignore: Iterable[str] = (), include_hidden=False, sort=False) -> Iterator[Path]:
+    for entry in iter_dir_entries(root, ignore=ignore, include_hidden=include_hidden, sort=sort):
+        if entry.is_file():
+            yield root / entry.name
 
 
 def listdir_grouped(root: Path, ignore_folders=[], include_hidden=False) -> Tuple[List, List]:
@@ -390,21 +1242,11 @@ def listdir_grouped(root: Path, ignore_folders=[], include_hidden=False) -> Tupl
     Examples:
         >>> dirs, files = listdir_grouped(".")
     """
-    if isinstance(root, str):
-        root = Path(root)
-
-    paths = [x for x in root.iterdir()]
+    root = Path(root)
 
     dirs, files = [], []
-    for path in paths:
-        condition = not include_hidden and path.name.startswith('.')
-        condition = condition and path.name not in ignore_folders
-        condition = not condition
-        if condition:
-            dirs.append(path) if path.is_dir() else files.append(path)
-
-    dirs.sort()
-    files.sort()
+    for entry in iter_dir_entries(root, ignore=ignore_folders, include_hidden=include_hidden, sort=True):
+        dirs.append(root / entry.name) if entry.is_dir() else files.append(root / entry.name)
 
     return dirs, files
 
@@ -428,19 +1270,11 @@ def is_hidden(dirpath: Path) -> bool:
 
 
 def list_nonhidden_dirs(dirpath: Path) -> List[Path]:
-    dirlist = []
-    for path in sorted(dirpath.iterdir()):
-        if path.is_dir() and not is_hidden(path):
-            dirlist.append(path)
-    return dirlist
+    return list(iter_dirs(dirpath, sort=True))
 
 
 def list_nonhidden_files(dirpath: Path) -> List[Path]:
-    dirlist = []
-    for path in sorted(dirpath.iterdir()):
-        if path.is_file() and not is_hidden(path):
-            dirlist.append(path)
-    return dirlist
+    return list(iter_files(dirpath, sort=True))
 
 
 def read_config(configpath: Path) -> dict:
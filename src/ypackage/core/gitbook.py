@@ -1,8 +1,14 @@
 import logging
+import re
+from hashlib import sha1
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
-from . import filesystem, github, markdown
+from ..model.cache import HttpCache, SummaryCache, TitleCache
+from ..model.filesystem import DirectoryTree
+from ..model.github import CommitFilter
+from . import background, filesystem, github, markdown
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +24,10 @@ SUMMARY_FILE = "SUMMARY.md"
 SUMMARY_FILE_HEADER = "📋 Table of Contents"
 
 CHANGELOG_HEADER = u"👀 Neler değişti"
+# Changelog'a işlenen en yeni commit, sonraki çalışmada sadece yeni commitler okunur
+CHANGELOG_MARKER = "Son commit: {}"
+CHANGELOG_MARKER_REGEX = re.compile(r"<!--\s*Son commit: ([0-9a-f]+)\s*-->")
+CHANGELOG_MARKER_READ_LIMIT = 4 * 1024
 CONTRIBUTING_HEADER = u"💖 Katkıda Bulunma Rehberi"
 GITHUB_USERNAME = "yedhrab"
 
@@ -26,7 +36,9 @@ def generate_readme_for_project(
     projectpath: Path,
     commentindex: str,
     ignore: List[str] = [],
-    must_inserted=False
+    must_inserted=False,
+    tree: Optional[DirectoryTree] = None,
+    jobs: int = 1
 ) -> bool:
     """Proje için markdown olmayan dosyaların bağlantılarının listesini README
     dosyasına verilen indeksler arasına yerleştirir
@@ -39,29 +51,39 @@ def generate_readme_for_project(
     Keyword Arguments:
         must_inserted {bool} -- Dosyada indeks olmaza, dosya sonuna indeks ile ekler \
             (default: {False})
+        tree {Optional[DirectoryTree]} -- Projenin dizin ağacı, verilmezse oluşturulur \
+            (default: {None})
+        jobs {int} -- README dosyalarını paralel oluşturacak thread sayısı, raporlar yine \
+            dizin sırasına göre yazılır (default: {1})
 
     Returns:
         {bool} -- Değişim varsa True
     """
 
     # TODO: Depth özelliği eklenmeli
-    dirpaths = filesystem.list_nonhidden_dirs(projectpath)
-    for dirpath in dirpaths:
-        if dirpath.name not in ignore:
-            generate_readme_for_dir(
-                dirpath,
-                commentindex,
-                must_inserted=must_inserted
-            )
-            generate_readme_for_project(
-                dirpath,
-                commentindex,
-                ignore=ignore,
-                must_inserted=must_inserted
-            )
+    if not tree:
+        tree = DirectoryTree.from_path(projectpath, ignore=ignore)
+
+    directories = [directory for subtree in tree.dirs for directory in subtree.walk()]
+
+    def generate(directory: DirectoryTree) -> bool:
+        return generate_readme_for_dir(
+            directory.path,
+            commentindex,
+            must_inserted=must_inserted,
+            filepaths=directory.files
+        )
+
+    results = background.map_in_order(generate, directories, jobs=jobs)
+    return any(results)
 
 
-def generate_readme_for_dir(dirpath: Path, index_string: str, must_inserted=False) -> bool:
+def generate_readme_for_dir(
+    dirpath: Path,
+    index_string: str,
+    must_inserted=False,
+    filepaths: Optional[List[Path]] = None
+) -> bool:
     """Dizin için markdown olmayan dosyaların bağlantılarının listesini README
     dosyasına verilen indeksler arasına yerleştirir
 
@@ -72,12 +94,14 @@ def generate_readme_for_dir(dirpath: Path, index_string: str, must_inserted=Fals
     Keyword Arguments:
         must_inserted {bool} -- Dosyada indeks olmaza, dosya sonuna indeks ile ekler \
             (default: {False})
+        filepaths {Optional[List[Path]]} -- Dizindeki sıralı dosyalar, verilmezse dizin \
+            listelenir (default: {None})
 
     Returns:
         {bool} -- Değişim varsa True
     """
 
-    content = markdown.generate_nonmarkdown_fileliststring(dirpath)
+    content = markdown.generate_nonmarkdown_fileliststring(dirpath, filepaths=filepaths)
     if not content:
         return False
 
@@ -126,7 +150,9 @@ def generate_filelink_string(
     github_link=False,
     indent_level=0,
     single_line=False,
-    is_list=False
+    is_list=False,
+    limit: Optional[int] = markdown.TITLE_READ_LIMIT,
+    cache: Optional[TitleCache] = None
 ) -> str:
     """GitBook için dosya link metni oluşturma
 
@@ -136,6 +162,9 @@ def generate_filelink_string(
     Keyword Arguments:
         root {Path} -- Çalışma dizini yolu objesi (default: {Path.cwd()})
         github_link {bool} -- GitHub adresini işaret etme (default: {False})
+        limit {Optional[int]} -- İsim için başlık aranırken okunacak en fazla bayt sayısı \
+            (default: {TITLE_READ_LIMIT})
+        cache {Optional[TitleCache]} -- İsimler için kullanılacak önbellek (default: {None})
 
     Returns:
         str -- Oluşturulan link metni
@@ -156,7 +185,7 @@ def generate_filelink_string(
     """
 
     if github_link:
-        name = markdown.generate_name_for_markdownfile(filepath)
+        name = markdown.generate_name_for_markdownfile(filepath, limit=limit, cache=cache)
         rawlink = github.get_github_raw_link(
             GITHUB_USERNAME,
             "YPackage" if Path.cwd().name == "project" else Path.cwd().name,  # TODO: burayı düzelt
@@ -175,7 +204,9 @@ def generate_filelink_string(
         root=root,
         indent_level=indent_level,
         single_line=single_line,
-        is_list=is_list
+        is_list=is_list,
+        limit=limit,
+        cache=cache
     )
 
 
@@ -233,55 +264,147 @@ def generate_description_section(string: str) -> str:
     return DESCRIPTION_TEMPLATE.format(string)
 
 
-def generate_summary_fileliststring(projectpath: Path, ignore: List[str] = []) -> str:
+def generate_summary_fileliststring(
+    projectpath: Path,
+    ignore: List[str] = [],
+    cache: Optional[TitleCache] = None,
+    summary_cache: Optional[SummaryCache] = None,
+    tree: Optional[DirectoryTree] = None
+) -> str:
     return generate_summary_filelinks_string(
         projectpath,
         projectpath,
         indent_level=0,
-        ignore=ignore
+        ignore=ignore,
+        cache=cache,
+        summary_cache=summary_cache,
+        tree=tree
     )
 
 
-def generate_summary_filelinks_string(
+def generate_summary_fingerprint(tree: DirectoryTree, indent_level: int = 0, ignore: List[str] = []) -> str:
+    """SUMMARY parçası için dizinin parmak izini oluşturur
+
+    Parmak izi dizindeki isimler ile markdown dosyalarının değiştirilme zamanı ve \
+        boyutundan oluşur, bu sebeple markdown dosyaları okunmaz
+
+    Arguments:
+        tree {DirectoryTree} -- Dizin ağacı
+
+    Keyword Arguments:
+        indent_level {int} -- Dizinin SUMMARY içerisindeki girinti seviyesi (default: {0})
+        ignore {List[str]} -- Görmezden gelinecek dosya ve dizin isimleri (default: {[]})
+
+    Returns:
+        str -- Parmak izi
+    """
+    fingerprint = sha1(f"{indent_level}|{sorted(ignore)}".encode("utf-8"))
+    for directory in tree.dirs:
+        fingerprint.update(f"{directory.path.name}/\0".encode("utf-8", errors="surrogateescape"))
+
+    for filepath in tree.files:
+        fingerprint.update(filepath.name.encode("utf-8", errors="surrogateescape"))
+        if markdown.is_markdownfile(filepath):
+            stat = filepath.stat()
+            fingerprint.update(f"|{stat.st_mtime_ns}|{stat.st_size}".encode("utf-8"))
+        fingerprint.update(b"\0")
+
+    return fingerprint.hexdigest()
+
+
+def generate_summary_fragment(
     projectpath: Path,
-    dirpath: Path,
+    tree: DirectoryTree,
     indent_level: int = 0,
-    ignore: List[str] = []
+    ignore: List[str] = [],
+    cache: Optional[TitleCache] = None,
+    summary_cache: Optional[SummaryCache] = None
 ) -> str:
+    """Dizinin kendi markdown dosyaları için SUMMARY parçasını oluşturur, alt dizinleri \
+        dahil etmez
+
+    Arguments:
+        projectpath {Path} -- Proje dizini yolu
+        tree {DirectoryTree} -- Dizin ağacı
+
+    Keyword Arguments:
+        indent_level {int} -- Girinti seviyesi (default: {0})
+        ignore {List[str]} -- Ağaç oluşturulurken görmezden gelinen isimler (default: {[]})
+        cache {Optional[TitleCache]} -- Dosya isimleri için kullanılacak önbellek (default: {None})
+        summary_cache {Optional[SummaryCache]} -- Dizin değişmediyse parçayı buradan okur \
+            (default: {None})
+
+    Returns:
+        str -- SUMMARY parçası
+    """
+    if summary_cache:
+        key = tree.path.absolute().relative_to(projectpath.absolute()).as_posix()
+        fingerprint = generate_summary_fingerprint(tree, indent_level=indent_level, ignore=ignore)
+
+        content = summary_cache.get(key, fingerprint)
+        if content is not None:
+            return content
+
     content = ""
 
-    readme_path = markdown.readmepath_for_dir(dirpath)
+    readme_path = markdown.readmepath_for_dir(tree.path)
     content += generate_filelink_string(
         readme_path,
         root=projectpath,
         indent_level=indent_level - 1 if indent_level else 0,
         single_line=True,
-        is_list=True
+        is_list=True,
+        cache=cache
     )
 
-    mpaths = markdown.list_markdownfiles(dirpath)
-    if readme_path in mpaths:
-        mpaths.remove(readme_path)
-
-    for mpath in mpaths:
-        if mpath.name not in ignore:
+    for mpath in tree.files:
+        if markdown.is_markdownfile(mpath) and mpath != readme_path:
             content += generate_filelink_string(
                 mpath,
                 root=projectpath,
                 indent_level=indent_level,
                 single_line=True,
-                is_list=True
+                is_list=True,
+                cache=cache
             )
 
-    directories = filesystem.list_nonhidden_dirs(dirpath)
-    for directory in directories:
-        if directory.name not in ignore:
-            content += generate_summary_filelinks_string(
-                projectpath,
-                directory,
-                indent_level=indent_level + 1,
-                ignore=ignore
-            )
+    if summary_cache:
+        summary_cache.set(key, fingerprint, content)
+
+    return content
+
+
+def generate_summary_filelinks_string(
+    projectpath: Path,
+    dirpath: Path,
+    indent_level: int = 0,
+    ignore: List[str] = [],
+    cache: Optional[TitleCache] = None,
+    summary_cache: Optional[SummaryCache] = None,
+    tree: Optional[DirectoryTree] = None
+) -> str:
+    if not tree:
+        tree = DirectoryTree.from_path(dirpath, ignore=ignore)
+
+    content = generate_summary_fragment(
+        projectpath,
+        tree,
+        indent_level=indent_level,
+        ignore=ignore,
+        cache=cache,
+        summary_cache=summary_cache
+    )
+
+    for subtree in tree.dirs:
+        content += generate_summary_filelinks_string(
+            projectpath,
+            subtree.path,
+            indent_level=indent_level + 1,
+            ignore=ignore,
+            cache=cache,
+            summary_cache=summary_cache,
+            tree=subtree
+        )
 
     return content
 
@@ -304,7 +427,10 @@ def generate_summary_for_project(
     projectpath: Path,
     index_string: str,
     ignore: List[str] = [],
-    must_inserted=False
+    must_inserted=False,
+    cache: Optional[TitleCache] = None,
+    summary_cache: Optional[SummaryCache] = None,
+    tree: Optional[DirectoryTree] = None
 ) -> bool:
     """Verilen dizin için markdown dosyalarının bağlantılarının listesini SUMMARY
     dosyasına verilen indeksler arasına yerleştirir
@@ -316,6 +442,11 @@ def generate_summary_for_project(
 
     Keyword Arguments:
         must_inserted {bool} -* [description] (default: {False})
+        cache {Optional[TitleCache]} -- Dosya isimleri için kullanılacak önbellek (default: {None})
+        summary_cache {Optional[SummaryCache]} -- Sadece değişen dizinlerin SUMMARY parçalarını \
+            yeniden oluşturmak için kullanılacak önbellek (default: {None})
+        tree {Optional[DirectoryTree]} -- Projenin dizin ağacı, verilmezse oluşturulur \
+            (default: {None})
 
     Returns:
         {bool} -- Değişim varsa True
@@ -327,7 +458,10 @@ def generate_summary_for_project(
 
     content = generate_summary_fileliststring(
         projectpath,
-        ignore=ignore
+        ignore=ignore,
+        cache=cache,
+        summary_cache=summary_cache,
+        tree=tree
     )
     if not content:
         return False
@@ -360,41 +494,156 @@ def get_summary_url_from_repo_url(repo_url):
     return github.generate_raw_url_from_repo_url(repo_url) + "/" + SUMMARY_FILE
 
 
-def read_summary_from_url(repo_url):
+def read_summary_from_url(repo_url, cache: Optional[HttpCache] = None):
     raw_url = get_summary_url_from_repo_url(repo_url)
-    return filesystem.read_file_from_url(raw_url)
+    return filesystem.read_file_from_url(raw_url, cache=cache)
+
+
+def read_summaries_from_urls(
+    repo_urls: List[str],
+    jobs: int = 1,
+    cache: Optional[HttpCache] = None
+) -> List[str]:
+    raw_urls = [get_summary_url_from_repo_url(repo_url) for repo_url in repo_urls]
+    return filesystem.read_files_from_urls(raw_urls, jobs=jobs, cache=cache)
+
+
+def find_changelog_marker(filepath: Path) -> Optional[str]:
+    """CHANGELOG dosyasının başlık kısmından en son işlenen commit hash değerini bulur
+
+    Arguments:
+        filepath {Path} -- CHANGELOG dosyası
+
+    Returns:
+        Optional[str] -- Commit hash değeri, işaret yoksa `None`
+    """
+    for line in filesystem.iter_lines(filepath, limit=CHANGELOG_MARKER_READ_LIMIT):
+        match = CHANGELOG_MARKER_REGEX.search(line)
+        if match:
+            return match[1]
+
+    return None
+
+
+def iter_changelog_links(filepath: Path) -> Iterator[str]:
+    """CHANGELOG dosyasındaki işaretten sonraki satırları tek tek okur
+
+    Arguments:
+        filepath {Path} -- CHANGELOG dosyası
+
+    Returns:
+        Iterator[str] -- Bağlantı satırları, satır sonları ile birlikte
+    """
+    lines = filesystem.iter_lines(filepath)
+    for line in lines:
+        if CHANGELOG_MARKER_REGEX.search(line):
+            break
+
+    yield from lines
+
+
+def find_changelog_start(path: Path, filepath: Path) -> Optional[str]:
+    """CHANGELOG dosyasının güncellenmeye başlanacağı commit hash değerini bulur
+
+    Arguments:
+        path {Path} -- Repo dizini
+        filepath {Path} -- CHANGELOG dosyası
+
+    Returns:
+        Optional[str] -- İşaretteki commit, işaret yoksa veya commit artık geçmişte \
+            bulunmuyorsa `None`
+    """
+    last_hash = find_changelog_marker(filepath) if filepath.exists() else None
+    if last_hash and not github.is_ancestor(path, last_hash):
+        logger.info(f"{last_hash} commiti geçmişte bulunamadı, changelog yeniden oluşturulacak")
+        return None
+
+    return last_hash
+
+
+def generate_changelog_chunks(
+    newest_hash: str, links: Iterable[str], old_filepath: Optional[Path] = None
+) -> Iterator[str]:
+    """CHANGELOG dosyasının içeriğini parça parça üretir
+
+    Arguments:
+        newest_hash {str} -- İşarete yazılacak en yeni commit hash değeri
+        links {Iterable[str]} -- Yeni bağlantılar, yeniden eskiye
+
+    Keyword Arguments:
+        old_filepath {Optional[Path]} -- Var olan bağlantıları yeni bağlantılardan \
+            sonra eklenecek CHANGELOG dosyası (default: {None})
+
+    Returns:
+        Iterator[str] -- Dosya içeriği parçaları
+    """
+    yield "# " + CHANGELOG_HEADER + "\n\n"
+    yield "## 📋 Tüm Değişiklikler\n\n"
+    yield markdown.Comment(CHANGELOG_MARKER.format(newest_hash)).to_str() + "\n"
+    for index, link in enumerate(links):
+        if index:
+            yield "\n"
+        yield link
+
+    if old_filepath:
+        old_links = iter_changelog_links(old_filepath)
+        first_old_link = next(old_links, None)
+        if first_old_link:
+            yield "\n"
+            yield first_old_link
+            yield from old_links
 
 
 def create_changelog(
-    path: Path, ignore_commits=[], repo_url=None, push=False, commit_msg=None
+    path: Path, ignore_commits=[], repo_url=None, push=False, commit_msg=None,
+    backend: str = github.DEFAULT_COMMIT_BACKEND
 ):
+    """Commit geçmişinden CHANGELOG dosyasını oluşturur
+
+    Dosyadaki işaret ile belirtilen committen sonraki commitler okunup var olan \
+        bağlantıların önüne eklenir. İşaret yoksa veya commit artık geçmişte \
+        bulunmuyorsa tüm geçmiş okunur. Commitler üretildikçe geçici dosyaya \
+        yazılır, geçmiş belleğe alınmaz.
+    Yeni bağlantı yoksa dosyaya dokunulmaz ve push yapılmaz.
+
+    Arguments:
+        path {Path} -- Repo dizini
+
+    Keyword Arguments:
+        ignore_commits {list} -- Başlığı bu şablonlara uyan commitler atlanır, \
+            bkz. `CommitFilter.from_patterns` (default: {[]})
+        repo_url {str} -- Repo URL'i (default: {None})
+        push {bool} -- Değişiklik varsa GitHub'a gönderir (default: {False})
+        commit_msg {str} -- Commit mesajı (default: {None})
+        backend {str} -- Commitleri okuyacak arka uç, `git` veya `pydriller` \
+            (default: {github.DEFAULT_COMMIT_BACKEND})
+    """
     if not commit_msg:
         commit_msg = "💫 YGitBookIntegration"
 
     cpath = markdown.SpecialFile.CHANGELOG.get_filepath(path)
+    last_hash = find_changelog_start(path, cpath)
 
-    filestr = "# " + CHANGELOG_HEADER
-    filestr += "\n\n"
-    filestr += "## 📋 Tüm Değişiklikler"
-    filestr += "\n\n"
+    commits = github.iter_commits(path, since=last_hash, backend=backend)
+    newest_commit = next(commits, None)
+    if newest_commit is None:
+        return
 
-    links = github.list_commit_links(
+    links = github.iter_commit_links(
         path, repo_url=repo_url,
-        ignore_commits=ignore_commits + [commit_msg]
+        ignore_commits=CommitFilter.from_patterns(ignore_commits, substrings=[commit_msg]),
+        commits=chain([newest_commit], commits)
     )
 
-    if not links:
+    # Sadece atlanan commitler varsa işaret güncellenmez, aksi halde her push yeni bir push doğurur
+    first_link = next(links, None)
+    if first_link is None:
         return
 
-    filestr += "\n".join(links)
-
-    oldfilestr = ""
-    if cpath.exists():
-        with cpath.open("r", encoding="utf-8") as file:
-            oldfilestr = file.read()
-
-    if oldfilestr != filestr:
-        filesystem.write_to_file(cpath, filestr)
-
+    chunks = generate_changelog_chunks(
+        newest_commit.hash, chain([first_link], links),
+        old_filepath=cpath if last_hash else None
+    )
+    if filesystem.write_chunks_to_file(cpath, chunks):
         if push:
             github.push_to_github(path, [cpath], commit_msg)
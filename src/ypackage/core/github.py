@@ -1,8 +1,11 @@
 import logging
 import os
+import subprocess
+from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Union
 
+from ..model.github import Commit, CommitFilter, GitResult, PushResult
 from . import markdown
 
 logger = logging.getLogger(__name__)
@@ -10,6 +13,12 @@ logger = logging.getLogger(__name__)
 # TODO: Class yapısına dahil olmalı
 DIFF_TEMPLATE = "{}/commit/{}?diff=split"
 
+DEFAULT_COMMIT_BACKEND = "git"
+# Hash, yazar, ISO tarih ve mesaj; alanlar \x1f, commitler `-z` ile \0 ile ayrılır
+GIT_LOG_FORMAT = "%H%x1f%an%x1f%aI%x1f%B"
+GIT_LOG_CHUNK_SIZE = 64 * 1024
+GIT_ADD_BATCH_SIZE = 1000
+
 
 def get_github_url() -> str:
     return r"https://github.com"
@@ -60,88 +69,305 @@ def generate_raw_url_from_repo_url(repo_url) -> str:
     return create_rawurl(username, reponame)
 
 
-def push_to_github(gpath: Path, paths: List[Path], commit: str):
-    if len(paths) > 0:
-        cur_dir = os.getcwd()
-        os.chdir(gpath)
+def run_git(path: Path, args: List[str], input: Optional[bytes] = None) -> GitResult:
+    """Git komutunu çalışma dizinini değiştirmeden, kabuk kullanmadan çalıştırır
 
-        logger.info("""
-        ----------------------------------------
-        f"{gpath} için push işlemi:"
-        ----------------------------------------
-        """.strip())
+    Arguments:
+        path {Path} -- Repo dizini
+        args {List[str]} -- `git` sonrasındaki argümanlar
 
-        command = " &&".join([f"git add {path.relative_to(gpath)}" for path in paths])
-        command += " &&" + f'git commit -m "{commit}"'
-        command += " &&" + f"git push -u origin master"
+    Keyword Arguments:
+        input {Optional[bytes]} -- Komutun stdin girdisi (default: {None})
 
-        os.system(command)
-        os.chdir(cur_dir)
+    Returns:
+        GitResult -- Komutun sonucu
+    """
+    try:
+        process = subprocess.run(
+            ["git", *args], cwd=path, input=input,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+        )
+    except OSError as error:
+        result = GitResult(args, -1, str(error))
+    else:
+        result = GitResult(args, process.returncode, process.stdout.decode("utf-8", errors="replace").strip())
 
+    logger.debug(f"{result} [{result.returncode}]: {result.output}")
+    return result
 
-def get_remote_url(path) -> str:
-    from subprocess import Popen, PIPE
 
-    cur_dir = os.getcwd()
-    os.chdir(path)
+def stage_paths(path: Path, paths: List[Path], batch_size: int = GIT_ADD_BATCH_SIZE) -> List[GitResult]:
+    """Dosyaları `git add --pathspec-from-file` ile gruplar halinde ekler
+
+    Yollar stdin üzerinden NUL ile ayrılarak verilir, komut satırı uzunluk \
+        sınırına takılmaz. Yollardaki `*` gibi karakterler şablon olarak yorumlanmaz.
+
+    Arguments:
+        path {Path} -- Repo dizini
+        paths {List[Path]} -- Eklenecek dosyalar
+
+    Keyword Arguments:
+        batch_size {int} -- Tek `git add` ile eklenecek en fazla dosya (default: {GIT_ADD_BATCH_SIZE})
+
+    Returns:
+        List[GitResult] -- Her grup için sonuç, hata olursa kalan gruplar eklenmez
+    """
+    pathspecs = [Path(os.path.relpath(filepath, path)).as_posix().encode("utf-8") for filepath in paths]
+
+    results = []
+    for index in range(0, len(pathspecs), batch_size):
+        result = run_git(
+            path,
+            ["--literal-pathspecs", "add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+            input=b"\0".join(pathspecs[index:index + batch_size])
+        )
+        results.append(result)
+        if not result.ok:
+            break
+
+    return results
+
+
+def push_to_github(gpath: Path, paths: List[Path], commit: str, push=True) -> PushResult:
+    """Dosyaları ekler, commit oluşturur ve isteğe bağlı olarak push eder
+
+    Eklenen dosyalarda değişiklik yoksa commit ve push yapılmaz
+
+    Arguments:
+        gpath {Path} -- Repo dizini
+        paths {List[Path]} -- Gönderilecek dosyalar
+        commit {str} -- Commit mesajı
+
+    Keyword Arguments:
+        push {bool} -- Commit sonrası mevcut dalı `origin`'e gönderir (default: {True})
+
+    Returns:
+        PushResult -- Adımların sonuçları
+    """
+    result = PushResult(paths)
+    if not paths:
+        return result
+
+    logger.info(f"{gpath} için push işlemi: {len(paths)} dosya")
+
+    result.results += stage_paths(gpath, paths)
+    result.staged = all(git_result.ok for git_result in result.results)
+
+    if result.staged:
+        # Çıkış kodu 1 ise eklenmiş değişiklik vardır
+        if run_git(gpath, ["diff", "--cached", "--quiet"]).returncode == 0:
+            logger.info(f"{gpath} için gönderilecek değişiklik yok")
+        else:
+            result.results.append(run_git(gpath, ["commit", "-m", commit]))
+            result.committed = result.results[-1].ok
+
+            if push and result.committed:
+                result.results.append(run_git(gpath, ["push", "-u", "origin", "HEAD"]))
+                result.pushed = result.results[-1].ok
+
+    for error in result.errors:
+        logger.error(f"{error} başarısız oldu: {error.output}")
 
+    return result
+
+
+def get_remote_url(path) -> str:
     remote_url = ""
     try:
-        with Popen(r'git config --get remote.origin.url', stdout=PIPE, stderr=PIPE) as p:
-            output, errors = p.communicate()
-            remote_url = output.decode('utf-8').splitlines()[0].replace(".git", "")
+        result = subprocess.run(
+            ["git", "config", "--get", "remote.origin.url"],
+            cwd=path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        remote_url = result.stdout.decode('utf-8').splitlines()[0].replace(".git", "")
     except Exception:
         logger.error("Repo URL is undefined")
 
-    os.chdir(cur_dir)
-
     return remote_url
 
 
-def list_commit_links(
-    path: Path,
-    repo_url=None,
-    ignore_commits=[],
-    table_form=False
-) -> List[str]:
+def is_ancestor(path: Path, commit_hash: str, ref: str = "HEAD") -> bool:
+    """Commit'in verilen referansın geçmişinde olup olmadığını kontrol eder
+
+    Arguments:
+        path {Path} -- Repo dizini
+        commit_hash {str} -- Commit hash değeri
+
+    Keyword Arguments:
+        ref {str} -- Geçmişi kontrol edilecek referans (default: {"HEAD"})
+
+    Returns:
+        bool -- Geçmişte ise `True`, git çalıştırılamazsa `False`
+    """
+    try:
+        result = subprocess.run(
+            ["git", "merge-base", "--is-ancestor", commit_hash, ref],
+            cwd=path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    except OSError:
+        return False
+
+    return result.returncode == 0
+
+
+def _iter_commits_with_git(path: Path, since: Optional[str] = None) -> Iterator[Commit]:
+    """Commitleri tek bir `git log` sürecinin çıktısını akış halinde okuyarak üretir"""
+    revision = f"{since}..HEAD" if since else "HEAD"
+    command = ["git", "log", "-z", f"--format={GIT_LOG_FORMAT}", revision, "--"]
+
+    try:
+        process = subprocess.Popen(command, cwd=path, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError:
+        logger.error("git çalıştırılamadı")
+        return
+
+    try:
+        buffer = b""
+        for chunk in iter(lambda: process.stdout.read(GIT_LOG_CHUNK_SIZE), b""):
+            records = (buffer + chunk).split(b"\0")
+            buffer = records.pop()
+            for record in records:
+                yield _parse_git_log_record(record)
+
+        if buffer:
+            yield _parse_git_log_record(buffer)
+
+        process.wait()
+        if process.returncode:
+            error = process.stderr.read().decode("utf-8", errors="replace").strip()
+            logger.error(f"Commitler okunamadı: {error}")
+    finally:
+        process.stdout.close()
+        process.stderr.close()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+def _parse_git_log_record(record: bytes) -> Commit:
+    hash_value, author, date, message = record.decode("utf-8", errors="replace").split("\x1f", 3)
+    return Commit(hash_value, message.split("\n")[0], author, datetime.fromisoformat(date))
+
+
+def _iter_commits_with_pydriller(path: Path, since: Optional[str] = None) -> Iterator[Commit]:
     from pydriller import RepositoryMining
     logging.getLogger('pydriller').setLevel(logging.ERROR)
 
-    if not repo_url:
-        repo_url = get_remote_url(path)
+    for commit in RepositoryMining(str(path), from_commit=since, order="reverse").traverse_commits():
+        if commit.hash == since:
+            break
 
-    if not repo_url:
-        return []
+        yield Commit(commit.hash, commit.msg.split("\n")[0], commit.author.name, commit.author_date)
+
+
+COMMIT_BACKENDS = {
+    "git": _iter_commits_with_git,
+    "pydriller": _iter_commits_with_pydriller,
+}
+
+
+def iter_commits(path: Path, since: Optional[str] = None, backend: str = DEFAULT_COMMIT_BACKEND) -> Iterator[Commit]:
+    """Commitleri en yeni commit ilk olacak şekilde tek tek üretir
+
+    `git` arka ucu tek bir `git log` süreci çalıştırır ve sadece changelog için \
+        gereken bilgileri okur; `pydriller` arka ucu her commit için nesne oluşturur.
+
+    Arguments:
+        path {Path} -- Repo dizini
+
+    Keyword Arguments:
+        since {Optional[str]} -- Verilirse sadece bu committen sonraki commitler üretilir \
+            (default: {None})
+        backend {str} -- `git` veya `pydriller` (default: {DEFAULT_COMMIT_BACKEND})
+
+    Returns:
+        Iterator[Commit] -- Commitler
+    """
+    return COMMIT_BACKENDS[backend](path, since=since)
+
+
+def generate_commit_link(commit: Commit, repo_url: str, table_form=False) -> str:
+    """Commit için changelog satırı oluşturur
+
+    Arguments:
+        commit {Commit} -- Commit
+        repo_url {str} -- Repo URL'i
 
-    links = []
+    Keyword Arguments:
+        table_form {bool} -- Tablo satırı olarak oluşturur (default: {False})
 
+    Returns:
+        str -- Changelog satırı
+
+    Examples:
+        >>> from datetime import datetime
+        >>> commit = Commit("e83c5163", "Selam", "Yunus Emre", datetime(2020, 4, 1, 12))
+        >>> generate_commit_link(commit, "https://github.com/u/r")
+        '- 01/04/2020 - 12:00:00 - [Selam](https://github.com/u/r/commit/e83c5163?diff=split) ~ Yunus Emre'
+    """
+    time = commit.date.strftime("%d/%m/%Y - %H:%M:%S")
+    url = DIFF_TEMPLATE.format(repo_url, commit.hash)
+
+    link_str = markdown.Link(commit.title, url).to_str()
     if table_form:
-        links.append("|📅 Tarih|🔀 Commit|🐥 Sahibi|")
-        links.append("|-|-|-|")
+        return f"|{time}|{link_str}|{commit.author}|"
 
-    for commit in RepositoryMining(str(path), order="reverse").traverse_commits():
-        title = commit.msg.split("\n")[0]
-        author = commit.author.name
+    return f"- {time} - {link_str} ~ {commit.author}"
 
-        ignore = False
-        for ignore_commit in ignore_commits:
-            if ignore_commit in title:
-                ignore = True
-                continue
 
-        if not ignore:
-            hash_value = commit.hash
-            time = commit.author_date.strftime("%d/%m/%Y - %H:%M:%S")
-            url = DIFF_TEMPLATE.format(repo_url, hash_value)
+def iter_commit_links(
+    path: Path,
+    repo_url=None,
+    ignore_commits: Union[List[str], CommitFilter] = [],
+    table_form=False,
+    commits: Optional[Iterable[Commit]] = None,
+    backend: str = DEFAULT_COMMIT_BACKEND
+) -> Iterator[str]:
+    """Commit bağlantılarını, en yeni commit ilk olacak şekilde tek tek üretir
 
-            link = markdown.Link(title, url)
-            link_str = link.to_str()
+    Arguments:
+        path {Path} -- Repo dizini
+
+    Keyword Arguments:
+        repo_url {str} -- Repo URL'i, verilmezse `origin` adresi kullanılır (default: {None})
+        ignore_commits {Union[List[str], CommitFilter]} -- Başlığı bu şablonlara uyan \
+            commitler atlanır, bkz. `CommitFilter.from_patterns` (default: {[]})
+        table_form {bool} -- Tablo satırları olarak oluşturur (default: {False})
+        commits {Optional[Iterable[Commit]]} -- Kullanılacak commitler, verilmezse tüm \
+            geçmiş okunur (default: {None})
+        backend {str} -- Commitleri okuyacak arka uç, `git` veya `pydriller` \
+            (default: {DEFAULT_COMMIT_BACKEND})
 
-            if table_form:
-                link_str = f"|{str(time)}|{link_str}|{author}|"
-            else:
-                link = f"- {str(time)} - {link_str} ~ {author}"
+    Returns:
+        Iterator[str] -- Bağlantı satırları
+    """
+    if not repo_url:
+        repo_url = get_remote_url(path)
 
-            links.append(link)
+    if not repo_url:
+        return
+
+    if commits is None:
+        commits = iter_commits(path, backend=backend)
+
+    if table_form:
+        yield "|📅 Tarih|🔀 Commit|🐥 Sahibi|"
+        yield "|-|-|-|"
+
+    if not isinstance(ignore_commits, CommitFilter):
+        ignore_commits = CommitFilter.from_patterns(ignore_commits)
+
+    for commit in commits:
+        if not ignore_commits.is_ignored(commit.title):
+            yield generate_commit_link(commit, repo_url, table_form=table_form)
 
-    return links
+
+def list_commit_links(
+    path: Path,
+    repo_url=None,
+    ignore_commits: Union[List[str], CommitFilter] = [],
+    table_form=False,
+    backend: str = DEFAULT_COMMIT_BACKEND
+) -> List[str]:
+    return list(iter_commit_links(
+        path, repo_url=repo_url, ignore_commits=ignore_commits, table_form=table_form, backend=backend
+    ))
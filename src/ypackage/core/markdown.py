@@ -2,11 +2,15 @@ from pathlib import Path
 from typing import Callable, List, Optional, Tuple
 from urllib.parse import quote
 
+from ..model.cache import TitleCache
 from ..model.markdown import Comment, Header, Indent, Link, SpecialFile
 from . import common, filesystem
 
 # TODO: \n \n arasında olması gerekebilir
 
+# Başlık aranırken dosyadan okunacak en fazla bayt sayısı
+TITLE_READ_LIMIT = 64 * 1024
+
 
 def generate_stringindexes_by_commentstring(
     index_string: str
@@ -228,22 +232,31 @@ def find_first_header(content) -> Optional[Header]:
     return Header.find_first(content)
 
 
-def find_first_header_from_file(filepath) -> Header:
+def find_first_header_from_file(filepath, limit: Optional[int] = TITLE_READ_LIMIT) -> Header:
     """Markdown dosyasının ilk başlığını okuma
+    Dosya satır satır okunur ve ilk başlık bulunduğunda okuma bırakılır
 
     Arguments:
         filepath {Path} -- Markdown dosyasının yolu
 
+    Keyword Arguments:
+        limit {Optional[int]} -- Başlık için okunacak en fazla bayt sayısı, `None` ise \
+            sınırsız (default: {TITLE_READ_LIMIT})
+
     Returns:
         str -- Başlığı varsa başlığı, yoksa dosya ismini döndürür
 
     Examples:
         >>> find_first_header_from_file(Path('docs/README.md'))
         Header(level=1, name='📦 YPackage')
+        >>> find_first_header_from_file(Path('docs/README.md'), limit=3)
     """
-    content = filesystem.read_file(filepath)
-    header = find_first_header(content)
-    return header
+    for line in filesystem.iter_lines(filepath, limit=limit):
+        header = find_first_header(line)
+        if header:
+            return header
+
+    return None
 
 
 def update_title_of_markdown(title: str, content: str) -> str:
@@ -294,11 +307,12 @@ def update_title_of_markdownfile(title: str, filepath: Path) -> bool:
         content {str} -- Markdown metni
 
     Returns:
-        str -- Değiştirilen markdown metni
+        bool -- Değişim olduysa True
     """
-    content = filesystem.read_file(filepath)
-    content = update_title_of_markdown(title, content)
-    return filesystem.write_to_file(filepath, content)
+    return filesystem.update_file(
+        filepath,
+        lambda content: update_title_of_markdown(title, content)
+    )
 
 
 def generate_headersection(level: str, name: str) -> str:
@@ -318,12 +332,20 @@ def generate_headersection(level: str, name: str) -> str:
     return Header(level, name).to_str(is_section=True)
 
 
-def generate_name_for_markdownfile(filepath: Path) -> str:
+def generate_name_for_markdownfile(
+    filepath: Path,
+    limit: Optional[int] = TITLE_READ_LIMIT,
+    cache: Optional[TitleCache] = None
+) -> str:
     """Markdown dosyası için isim belirler
 
     Arguments:
         filepath {Path} -- Markdown dosyasının yolu
 
+    Keyword Arguments:
+        limit {Optional[int]} -- Başlık için okunacak en fazla bayt sayısı (default: {TITLE_READ_LIMIT})
+        cache {Optional[TitleCache]} -- Dosya değişmediyse ismi buradan okur (default: {None})
+
     Returns:
         str -- Başlığı varsa başlığı, yoksa dosya ismini döndürür
 
@@ -334,11 +356,20 @@ def generate_name_for_markdownfile(filepath: Path) -> str:
         'LICENSE'
     """
 
-    header = None
-    if is_markdownfile(filepath):
-        header = find_first_header_from_file(filepath)
+    if not is_markdownfile(filepath):
+        return filepath.name
+
+    if cache:
+        name = cache.get(filepath)
+        if name is not None:
+            return name
+
+    header = find_first_header_from_file(filepath, limit=limit)
 
     name = header.name if header else filepath.name
+    if cache:
+        cache.set(filepath, name)
+
     return name
 
 
@@ -420,7 +451,9 @@ def generate_filelinkstring(
     root: Optional[Path] = None,
     indent_level=0,
     is_list: bool = False,
-    single_line: bool = False
+    single_line: bool = False,
+    limit: Optional[int] = TITLE_READ_LIMIT,
+    cache: Optional[TitleCache] = None
 ) -> str:
     """Özel dosya linki metni oluşturma
 
@@ -432,6 +465,9 @@ def generate_filelinkstring(
         indent_level {int} -- Varsa girinti seviyesi (default: {0})
         is_list {bool} -- Liste elamanı olarak tanımlama '- ' ekler (default: {False})
         single_line {bool} -- Tek satırda yer alan link '\\n' ekler (default: {False})
+        limit {Optional[int]} -- İsim için başlık aranırken okunacak en fazla bayt sayısı \
+            (default: {TITLE_READ_LIMIT})
+        cache {Optional[TitleCache]} -- İsimler için kullanılacak önbellek (default: {None})
 
     Returns:
         {str} -- Oluşturulan link metni
@@ -448,7 +484,7 @@ def generate_filelinkstring(
         '    * [YPackage](markdown.py)\\n'
     """
     if not name:
-        name = generate_name_for_markdownfile(filepath)
+        name = generate_name_for_markdownfile(filepath, limit=limit, cache=cache)
 
     if root:
         root = root.absolute()
@@ -466,16 +502,23 @@ def generate_filelinkstring(
     )
 
 
-def generate_nonmarkdown_fileliststring(dirpath: Path) -> str:
+def generate_nonmarkdown_fileliststring(dirpath: Path, filepaths: Optional[List[Path]] = None) -> str:
     """Markdown olmayan dosyalar için link metni oluşturma
 
     Arguments:
         dirpath {Path} -- Dosya yolu objesi
 
+    Keyword Arguments:
+        filepaths {Optional[List[Path]]} -- Dizindeki sıralı dosyalar, verilmezse dizin \
+            listelenir (default: {None})
+
     Returns:
         {str} -- Oluşturulan link metni
     """
-    nonmarkdown_filepaths = list_nonmarkdownfiles(dirpath)
+    if filepaths is None:
+        nonmarkdown_filepaths = list_nonmarkdownfiles(dirpath)
+    else:
+        nonmarkdown_filepaths = [path for path in filepaths if ".md" not in path.name]
 
     if not nonmarkdown_filepaths:
         return ""
@@ -600,9 +643,10 @@ def map_links_in_markdownfile(
     Returns:
         bool -- Değişim olduysa True
     """
-    content = filesystem.read_file(filepath)
-    content = map_links_in_string(content, func)
-    return filesystem.write_to_file(filepath, content)
+    return filesystem.update_file(
+        filepath,
+        lambda content: map_links_in_string(content, func)
+    )
 
 
 def list_nonmarkdownfiles(dirpath: Path) -> List[Path]:
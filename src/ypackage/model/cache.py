@@ -0,0 +1,287 @@
+import logging
+from json import JSONDecodeError
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..core import filesystem
+from . import common
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = ".ygitbookintegration_cache"
+
+
+def cachedir_for_workdir(workdir: Path) -> Path:
+    """Çalışma dizini için önbellek dizini yolu oluşturur
+
+    Arguments:
+        workdir {Path} -- Çalışma dizini
+
+    Returns:
+        Path -- Önbellek dizini yolu
+
+    Examples:
+        >>> cachedir_for_workdir(Path('docs')).as_posix()
+        'docs/.ygitbookintegration_cache'
+    """
+    return workdir / CACHE_DIRNAME
+
+
+class Cache(common.Base):
+
+    FILENAME = ""
+    VERSION = 1
+
+    ATTR_VERSION = "version"
+    ATTR_ENTRIES = "entries"
+
+    def __init__(self, filepath: Path, entries: Optional[Dict[str, dict]] = None):
+        """Çalışmalar arasında saklanan JSON tabanlı önbellek
+
+        Arguments:
+            filepath {Path} -- Önbelleğin kaydedileceği JSON dosyasının yolu
+
+        Keyword Arguments:
+            entries {Optional[Dict[str, dict]]} -- Önceden okunmuş kayıtlar (default: {None})
+        """
+        self.filepath = filepath
+        self.entries = entries if entries else {}
+        self.touched = set()
+        self.changed = False
+
+    def get_entry(self, key: str) -> Optional[dict]:
+        entry = self.entries.get(key)
+        if entry:
+            self.touched.add(key)
+        return entry
+
+    def set_entry(self, key: str, entry: dict):
+        self.entries[key] = entry
+        self.touched.add(key)
+        self.changed = True
+
+    def invalidate(self, key: Optional[str] = None):
+        """Verilen anahtarın kaydını, anahtar verilmezse tüm kayıtları siler
+
+        Keyword Arguments:
+            key {Optional[str]} -- Kaydı silinecek anahtar (default: {None})
+        """
+        if key:
+            if self.entries.pop(key, None):
+                self.changed = True
+        elif self.entries:
+            self.entries = {}
+            self.changed = True
+
+    def prune(self):
+        """Bu çalışmada kullanılmayan (silinmiş veya atlanmış) kayıtları siler"""
+        unused = set(self.entries) - self.touched
+        for key in unused:
+            del self.entries[key]
+
+        if unused:
+            self.changed = True
+
+    def save(self) -> bool:
+        """Değişiklik varsa önbelleği dosyaya yazar
+
+        Returns:
+            bool -- Yazma işlemi yapıldıysa `True`
+        """
+        if not self.changed:
+            return False
+
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        result = filesystem.write_json_to_file(self.filepath, {
+            self.ATTR_VERSION: self.VERSION,
+            self.ATTR_ENTRIES: self.entries
+        })
+        self.changed = not result
+        return result
+
+    @classmethod
+    def from_file(cls, filepath: Path):
+        entries = {}
+        if filepath.exists():
+            try:
+                data = filesystem.read_json(filepath)
+                if data.get(cls.ATTR_VERSION) == cls.VERSION:
+                    entries = data[cls.ATTR_ENTRIES]
+            except (JSONDecodeError, KeyError, AttributeError):
+                logger.warning(f"Önbellek dosyası okunamadı, yeniden oluşturulacak: {filepath}")
+
+        return cls(filepath, entries)
+
+    @classmethod
+    def from_workdir(cls, workdir: Path):
+        if not cls.FILENAME:
+            raise NotImplementedError
+
+        return cls.from_file(cachedir_for_workdir(workdir) / cls.FILENAME)
+
+
+class TitleCache(Cache):
+
+    FILENAME = "titles.json"
+
+    ATTR_MTIME = "mtime"
+    ATTR_SIZE = "size"
+    ATTR_NAME = "name"
+
+    @staticmethod
+    def key_for(filepath: Path) -> str:
+        return filepath.absolute().as_posix()
+
+    def get(self, filepath: Path) -> Optional[str]:
+        """Dosya değişmediyse önbellekteki ismini döndürür
+
+        Dosyanın değiştirilme zamanı veya boyutu değiştiyse kayıt geçersiz sayılır
+
+        Arguments:
+            filepath {Path} -- Markdown dosyasının yolu
+
+        Returns:
+            Optional[str] -- Önbellekteki isim, yoksa veya geçersizse `None`
+        """
+        entry = self.get_entry(self.key_for(filepath))
+        if not entry:
+            return None
+
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return None
+
+        if entry[self.ATTR_MTIME] != stat.st_mtime_ns or entry[self.ATTR_SIZE] != stat.st_size:
+            return None
+
+        return entry[self.ATTR_NAME]
+
+    def prune(self):
+        """Silinmiş dosyalara ait kayıtları siler
+
+        SUMMARY parçası önbellekten okunan dizinlerin dosyalarına bu çalışmada \
+            erişilmediğinden sadece artık var olmayan dosyaların kayıtları silinir
+        """
+        unused = [key for key in set(self.entries) - self.touched if not Path(key).exists()]
+        for key in unused:
+            del self.entries[key]
+
+        if unused:
+            self.changed = True
+
+    def set(self, filepath: Path, name: str):
+        """Dosyanın ismini güncel değiştirilme zamanı ve boyutu ile kaydeder
+
+        Arguments:
+            filepath {Path} -- Markdown dosyasının yolu
+            name {str} -- Dosya için belirlenen isim
+        """
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return
+
+        self.set_entry(self.key_for(filepath), {
+            self.ATTR_MTIME: stat.st_mtime_ns,
+            self.ATTR_SIZE: stat.st_size,
+            self.ATTR_NAME: name
+        })
+
+
+class SummaryCache(Cache):
+
+    FILENAME = "summary.json"
+
+    ATTR_FINGERPRINT = "fingerprint"
+    ATTR_FRAGMENT = "fragment"
+
+    def get(self, key: str, fingerprint: str) -> Optional[str]:
+        """Dizinin parmak izi değişmediyse SUMMARY parçasını döndürür
+
+        Arguments:
+            key {str} -- Dizinin proje dizinine göre yolu
+            fingerprint {str} -- Dizinin güncel parmak izi
+
+        Returns:
+            Optional[str] -- Önbellekteki SUMMARY parçası, yoksa veya geçersizse `None`
+        """
+        entry = self.get_entry(key)
+        if not entry or entry[self.ATTR_FINGERPRINT] != fingerprint:
+            return None
+
+        return entry[self.ATTR_FRAGMENT]
+
+    def set(self, key: str, fingerprint: str, fragment: str):
+        """Dizinin SUMMARY parçasını parmak izi ile kaydeder
+
+        Arguments:
+            key {str} -- Dizinin proje dizinine göre yolu
+            fingerprint {str} -- Dizinin güncel parmak izi
+            fragment {str} -- Dizin için oluşturulan SUMMARY parçası
+        """
+        self.set_entry(key, {
+            self.ATTR_FINGERPRINT: fingerprint,
+            self.ATTR_FRAGMENT: fragment
+        })
+
+
+class HttpCache(Cache):
+
+    FILENAME = "http.json"
+
+    ATTR_ETAG = "etag"
+    ATTR_LAST_MODIFIED = "last-modified"
+    ATTR_CONTENT = "content"
+
+    def get_headers(self, url: str) -> Dict[str, str]:
+        """URL için koşullu istek başlıklarını oluşturur
+
+        Arguments:
+            url {str} -- URL
+
+        Returns:
+            Dict[str, str] -- `If-None-Match` ve `If-Modified-Since` başlıkları, kayıt yoksa boş
+        """
+        entry = self.get_entry(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get(self.ATTR_ETAG):
+            headers["If-None-Match"] = entry[self.ATTR_ETAG]
+        if entry.get(self.ATTR_LAST_MODIFIED):
+            headers["If-Modified-Since"] = entry[self.ATTR_LAST_MODIFIED]
+        return headers
+
+    def get(self, url: str) -> Optional[str]:
+        """URL için saklanan içeriği döndürür (304 yanıtında kullanılır)
+
+        Arguments:
+            url {str} -- URL
+
+        Returns:
+            Optional[str] -- Saklanan içerik, yoksa `None`
+        """
+        entry = self.get_entry(url)
+        return entry[self.ATTR_CONTENT] if entry else None
+
+    def set(self, url: str, headers: Dict[str, str], content: str):
+        """Yanıtta `ETag` veya `Last-Modified` varsa içeriği saklar
+
+        Arguments:
+            url {str} -- URL
+            headers {Dict[str, str]} -- Küçük harfli yanıt başlıkları
+            content {str} -- Okunan içerik
+        """
+        etag = headers.get(self.ATTR_ETAG)
+        last_modified = headers.get(self.ATTR_LAST_MODIFIED)
+        if not etag and not last_modified:
+            self.invalidate(url)
+            return
+
+        self.set_entry(url, {
+            self.ATTR_ETAG: etag,
+            self.ATTR_LAST_MODIFIED: last_modified,
+            self.ATTR_CONTENT: content
+        })
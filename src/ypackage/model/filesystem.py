@@ -1,5 +1,9 @@
+import os
+import re
 from argparse import ArgumentParser
 from pathlib import Path
+from typing import (AnyStr, Callable, Dict, Iterator, List, Match, Optional,
+                    Pattern, Tuple, Union)
 
 from . import common
 
@@ -12,7 +16,7 @@ class OptionParser:
         )
         self.parser.add_argument(
             'paths',
-            nargs="+",
+            nargs="*",
             metavar='paths',
             help='Dizin yolları',
         )
@@ -41,15 +45,13 @@ class OptionParser:
             "--pattern",
             "-p",
             dest="pattern",
-            help="Değiştirilecek isimleri belirten regex şablonu",
-            required=True
+            help="Değiştirilecek isimleri belirten regex şablonu"
         )
         self.parser.add_argument(
             "--to",
             "-t",
             dest="to",
-            help="Şablona uygun isimleri verilen değer ile değiştirir",
-            required=True
+            help="Şablona uygun isimleri verilen değer ile değiştirir"
         )
         self.parser.add_argument(
             "--case-sensitive",
@@ -58,6 +60,54 @@ class OptionParser:
             dest="case_sensitive",
             help="Büyük küçük harf duyarlılığını aktif eder"
         )
+        self.parser.add_argument(
+            "--dry-run",
+            "-n",
+            action="store_true",
+            dest="dry_run",
+            help="Değişiklik yapmadan adlandırma planını gösterir"
+        )
+        self.parser.add_argument(
+            "--ignore",
+            "-ig",
+            nargs="+",
+            metavar="ignore",
+            default=[],
+            dest="ignore",
+            help="Atlanacak dosya ve dizinlerin `.gitignore` biçimindeki şablonları"
+        )
+        self.parser.add_argument(
+            "--gitignore",
+            "-gi",
+            action="store_true",
+            dest="gitignore",
+            help="Dizinlerdeki `.gitignore` dosyalarına uyan yolları atlar"
+        )
+        self.parser.add_argument(
+            "--jobs",
+            "-j",
+            default=1,
+            dest="jobs",
+            help="Farklı dizinlerdeki adlandırmaları paralel uygulayan thread sayısı",
+            type=int
+        )
+        self.parser.add_argument(
+            "--journal",
+            "-J",
+            default=None,
+            dest="journal",
+            help="Uygulanan adlandırmaların ekleneceği günlük dosyası",
+            type=Path
+        )
+        self.parser.add_argument(
+            "--undo",
+            "-u",
+            default=None,
+            dest="undo",
+            metavar="JOURNAL",
+            help="Günlük dosyasındaki adlandırmaları geri alır",
+            type=Path
+        )
         self.parser.add_argument(
             "--debug",
             "-d",
@@ -67,7 +117,13 @@ class OptionParser:
         )
 
     def parse_args(self):
-        return self.parser.parse_args()
+        args = self.parser.parse_args()
+        if not args.undo:
+            if not args.paths:
+                self.parser.error("the following arguments are required: paths")
+            if args.pattern is None or args.to is None:
+                self.parser.error("the following arguments are required: --pattern/-p, --to/-t")
+        return args
 
 
 class Options(common.Options):
@@ -81,6 +137,11 @@ class Options(common.Options):
         silent=False,
         dir_mode=False,
         case_sensitive=False,
+        dry_run=False,
+        ignore: List[str] = [],
+        gitignore=False,
+        jobs=1,
+        journal: Optional[Path] = None,
         debug=False
     ):
         self.workdir = workdir
@@ -90,6 +151,11 @@ class Options(common.Options):
         self.pattern = pattern
         self.to = to
         self.case_sensitive = case_sensitive
+        self.dry_run = dry_run
+        self.ignore = ignore
+        self.gitignore = gitignore
+        self.jobs = jobs
+        self.journal = journal
         self.debug = debug
 
     def __repr__(self):
@@ -101,18 +167,29 @@ class Options(common.Options):
             "pattern=" + repr(self.pattern) + \
             "to=" + repr(self.to) + \
             "case_sensitive=" + repr(self.case_sensitive) + \
+            "dry_run=" + repr(self.dry_run) + \
+            "ignore=" + repr(self.ignore) + \
+            "gitignore=" + repr(self.gitignore) + \
+            "jobs=" + repr(self.jobs) + \
+            "journal=" + repr(self.journal) + \
             "debug=" + repr(self.debug) + \
             ")"
 
     def load_system_args(self, workdir: Path):
         args = OptionParser().parse_args()
 
+        self.workdir = workdir
         self.recursive = args.recursive
         self.silent = args.silent
         self.dir_mode = args.dir_mode
         self.pattern = args.pattern
         self.to = args.to
         self.case_sensitive = args.case_sensitive
+        self.dry_run = args.dry_run
+        self.ignore = args.ignore
+        self.gitignore = args.gitignore
+        self.jobs = args.jobs
+        self.journal = args.journal
         self.debug = args.debug
 
         self.log_load(self.LOG_LOAD_SYSTEM_ARGS)
@@ -122,3 +199,474 @@ class Options(common.Options):
         options = cls()
         options.load_system_args(workdir)
         return options
+
+
+class IgnoreMatcher(common.Base):
+
+    IGNORE_FILENAMES = (".gitignore", ".ygitbookignore")
+
+    def __init__(self, rules: Optional[List[Tuple[str, bool, bool]]] = None, filenames: Tuple[str, ...] = ()):
+        """`.gitignore` kurallarına göre yolları eşleyen derlenmiş filtre
+
+        Tüm kurallar dizinler ve dosyalar için birer regex'te birleştirilir. \
+            Sonraki kural öncekini ezdiği için kurallar ters sırayla eklenir, \
+            eşleşen grubun ismi kuralı belirtir.
+
+        Keyword Arguments:
+            rules {Optional[List[Tuple[str, bool, bool]]]} -- (regex, olumsuz, sadece dizin) \
+                kuralları (default: {None})
+            filenames {Tuple[str, ...]} -- Alt dizinlerde okunacak kural dosyaları (default: {()})
+        """
+        self.rules = rules if rules else []
+        self.filenames = filenames
+
+        self._dir_regex = self._compile(self.rules)
+        self._file_regex = self._compile([rule for rule in self.rules if not rule[2]])
+
+    @staticmethod
+    def _compile(rules: List[Tuple[str, bool, bool]]) -> Optional[Pattern[str]]:
+        if not rules:
+            return None
+
+        return re.compile("|".join(
+            f"(?P<{'n' if negated else 'i'}{index}>{regex})"
+            for index, (regex, negated, _) in reversed(list(enumerate(rules)))
+        ))
+
+    @staticmethod
+    def translate(pattern: str) -> str:
+        """Glob şablonunu, `/` karakterini aşmayan regex'e çevirir
+
+        Arguments:
+            pattern {str} -- `*`, `?`, `[...]` ve `**` içerebilen şablon
+
+        Returns:
+            str -- Regex
+
+        Examples:
+            >>> IgnoreMatcher.translate("**/build/*.py[co]")
+            '(?:.*/)?build/[^/]*\\\\.py[co]'
+        """
+        regex = []
+        index = 0
+        while index < len(pattern):
+            char = pattern[index]
+            if pattern.startswith("**/", index) and (index == 0 or pattern[index - 1] == "/"):
+                regex.append("(?:.*/)?")
+                index += 3
+                continue
+
+            if pattern.startswith("**", index):
+                regex.append(".*")
+                index += 2
+                continue
+
+            if char == "*":
+                regex.append("[^/]*")
+            elif char == "?":
+                regex.append("[^/]")
+            elif char == "\\" and index + 1 < len(pattern):
+                index += 1
+                regex.append(re.escape(pattern[index]))
+            elif char == "[" and "]" in pattern[index + 2:]:
+                end = pattern.index("]", index + 2)
+                content = pattern[index + 1:end].replace("\\", "\\\\")
+                if content.startswith("!"):
+                    content = "^" + content[1:]
+                regex.append(f"[{content}]")
+                index = end
+            else:
+                regex.append(re.escape(char))
+            index += 1
+
+        return "".join(regex)
+
+    @classmethod
+    def parse_rule(cls, line: str, base: str = "") -> Optional[Tuple[str, bool, bool]]:
+        """`.gitignore` satırını kurala çevirir
+
+        Arguments:
+            line {str} -- Kural satırı
+
+        Keyword Arguments:
+            base {str} -- Kural dosyasının köke göre dizini, kök için '' (default: {""})
+
+        Returns:
+            Optional[Tuple[str, bool, bool]] -- (regex, olumsuz, sadece dizin), \
+                boş satır veya yorum ise `None`
+
+        Examples:
+            >>> IgnoreMatcher.parse_rule("!/docs/")
+            ('docs', True, True)
+            >>> IgnoreMatcher.parse_rule("node_modules/", base="a")
+            ('a/(?:.*/)?node_modules', False, True)
+        """
+        line = line.rstrip("\n").rstrip()
+        if not line or line.startswith("#"):
+            return None
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith("\\#") or line.startswith("\\!"):
+            line = line[1:]
+
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            return None
+
+        anchored = "/" in line
+        regex = cls.translate(line.lstrip("/"))
+        if not anchored and not regex.startswith("(?:.*/)?"):
+            regex = "(?:.*/)?" + regex
+
+        if base:
+            regex = re.escape(base) + "/" + regex
+
+        return regex, negated, dir_only
+
+    def is_ignored(self, relpath: str, is_dir=False) -> bool:
+        """Köke göre yolu verilen dosya veya dizinin atlanıp atlanmayacağını kontrol eder
+
+        Arguments:
+            relpath {str} -- Köke göre '/' ile ayrılmış yol
+
+        Keyword Arguments:
+            is_dir {bool} -- Yol dizin ise `True` (default: {False})
+
+        Returns:
+            bool -- Atlanacaksa `True`
+
+        Examples:
+            >>> matcher = IgnoreMatcher.from_patterns(["*.log", "build/", "!keep.log"])
+            >>> matcher.is_ignored("a/debug.log"), matcher.is_ignored("a/keep.log")
+            (True, False)
+            >>> matcher.is_ignored("a/build", is_dir=True), matcher.is_ignored("a/build")
+            (True, False)
+        """
+        regex = self._dir_regex if is_dir else self._file_regex
+        if not regex:
+            return False
+
+        match = regex.fullmatch(relpath)
+        return bool(match) and match.lastgroup[0] == "i"
+
+    def child(self, dirpath: Path, relpath: str) -> "IgnoreMatcher":
+        """Alt dizindeki kural dosyalarını da içeren filtreyi oluşturur
+
+        Dizinde kural dosyası yoksa aynı filtre döndürülür. Gereksiz dosya açmamak \
+            için sadece listelenen dizinde kural dosyası görüldüğünde çağrılmalıdır.
+
+        Arguments:
+            dirpath {Path} -- Alt dizin yolu
+            relpath {str} -- Alt dizinin köke göre yolu
+
+        Returns:
+            IgnoreMatcher -- Alt dizin için filtre
+        """
+        rules = self.read_rules(dirpath, relpath, self.filenames)
+        if not rules:
+            return self
+
+        return type(self)(self.rules + rules, self.filenames)
+
+    @classmethod
+    def read_rules(cls, dirpath: Path, relpath: str, filenames: Tuple[str, ...]) -> List[Tuple[str, bool, bool]]:
+        rules = []
+        for filename in filenames:
+            try:
+                lines = (dirpath / filename).read_text(encoding="utf-8").splitlines()
+            except (OSError, UnicodeDecodeError):
+                continue
+
+            rules += [rule for rule in (cls.parse_rule(line, base=relpath) for line in lines) if rule]
+
+        return rules
+
+    @classmethod
+    def from_patterns(cls, patterns: List[str], filenames: Tuple[str, ...] = ()) -> "IgnoreMatcher":
+        return cls([rule for rule in (cls.parse_rule(pattern) for pattern in patterns) if rule], filenames)
+
+    @classmethod
+    def from_path(
+        cls, path: Path, patterns: List[str] = [], filenames: Tuple[str, ...] = IGNORE_FILENAMES
+    ) -> "IgnoreMatcher":
+        """Verilen şablonlar ve kök dizindeki kural dosyalarından filtre oluşturur
+
+        Arguments:
+            path {Path} -- Kök dizin
+
+        Keyword Arguments:
+            patterns {List[str]} -- `.gitignore` biçiminde ek şablonlar, düz isimler her \
+                seviyede eşleşir (default: {[]})
+            filenames {Tuple[str, ...]} -- Okunacak kural dosyaları (default: {IGNORE_FILENAMES})
+
+        Returns:
+            IgnoreMatcher -- Filtre
+        """
+        matcher = cls.from_patterns(patterns, filenames)
+        return cls(matcher.rules + cls.read_rules(path, "", filenames), filenames)
+
+
+class DirectoryTree(common.Base):
+
+    def __init__(self, path: Path, dirs: List["DirectoryTree"], files: List[Path]):
+        """Dizin ağacının tek seferde alınmış görüntüsü
+
+        Arguments:
+            path {Path} -- Dizin yolu
+            dirs {List[DirectoryTree]} -- Sıralı alt dizinler
+            files {List[Path]} -- Sıralı dosyalar
+        """
+        self.path = path
+        self.dirs = dirs
+        self.files = files
+
+    def walk(self) -> Iterator["DirectoryTree"]:
+        """Ağaçtaki dizinleri, üst dizin alt dizinlerinden önce gelecek şekilde dolaşır
+
+        Returns:
+            Iterator[DirectoryTree] -- Dizinler
+        """
+        yield self
+        for directory in self.dirs:
+            yield from directory.walk()
+
+    @classmethod
+    def from_path(
+        cls, path: Path, ignore: Union[List[str], IgnoreMatcher] = [], include_hidden=False
+    ) -> "DirectoryTree":
+        """Dizin ağacını `os.scandir` ile her dizini bir kez listeleyerek oluşturur
+
+        Gizli dizinler ile `ignore` şablonlarına, `.gitignore` ve `.ygitbookignore` \
+            dosyalarına uyan yollar daha listelenmeden atlanır, atlanan dizinlere girilmez
+
+        Arguments:
+            path {Path} -- Kök dizin
+
+        Keyword Arguments:
+            ignore {Union[List[str], IgnoreMatcher]} -- Görmezden gelinecek dosya ve dizin \
+                şablonları veya hazır filtre (default: {[]})
+            include_hidden {bool} -- Gizli dizinleri dahil etme (default: {False})
+
+        Returns:
+            DirectoryTree -- Dizin ağacı
+        """
+        matcher = ignore if isinstance(ignore, IgnoreMatcher) else IgnoreMatcher.from_path(path, ignore)
+        return cls._from_path(path, "", matcher, include_hidden)
+
+    @classmethod
+    def _from_path(cls, path: Path, relpath: str, matcher: IgnoreMatcher, include_hidden: bool) -> "DirectoryTree":
+        with os.scandir(path) as iterator:
+            entries = list(iterator)
+
+        # Kök dizinin kural dosyaları filtre oluşturulurken okunur
+        if relpath and any(entry.name in matcher.filenames for entry in entries):
+            matcher = matcher.child(path, relpath)
+
+        prefix = relpath + "/" if relpath else ""
+
+        dirs, files = [], []
+        for entry in entries:
+            if entry.is_dir():
+                if include_hidden or not entry.name.startswith("."):
+                    if not matcher.is_ignored(prefix + entry.name, is_dir=True):
+                        dirs.append(entry.name)
+            elif entry.is_file() and not matcher.is_ignored(prefix + entry.name):
+                files.append(path / entry.name)
+
+        dirs.sort()
+        files.sort()
+
+        return cls(
+            path,
+            [cls._from_path(path / name, prefix + name, matcher, include_hidden) for name in dirs],
+            files
+        )
+
+
+class Rename(common.Base):
+
+    def __init__(self, source: Path, target: Path):
+        """Tek bir yeniden adlandırma adımı
+
+        Arguments:
+            source {Path} -- Mevcut yol
+            target {Path} -- Yeni yol
+        """
+        self.source = source
+        self.target = target
+
+    def __str__(self):
+        return f"{self.source} -> {self.target}"
+
+
+class RenamePlan(common.Base):
+
+    def __init__(self, renames: Optional[List[Rename]] = None, conflicts: Optional[List[str]] = None):
+        """Uygulanma sırasına dizilmiş yeniden adlandırma planı
+
+        Dizinler alt dizinlerinden sonra adlandırılacak şekilde sıralanır, \
+            böylece plandaki yollar uygulama sırasında geçersiz olmaz.
+
+        Keyword Arguments:
+            renames {Optional[List[Rename]]} -- Sıralı adımlar (default: {None})
+            conflicts {Optional[List[str]]} -- Planın uygulanmasını engelleyen çakışmalar \
+                (default: {None})
+        """
+        self.renames = renames if renames else []
+        self.conflicts = conflicts if conflicts else []
+
+    def __str__(self):
+        return "\n".join(
+            [str(rename) for rename in self.renames]
+            + [f"Çakışma: {conflict}" for conflict in self.conflicts]
+        )
+
+    def __len__(self):
+        return len(self.renames)
+
+    def is_valid(self) -> bool:
+        return not self.conflicts
+
+
+class RenameTemplate(common.Base):
+
+    TRANSFORMS: Dict[str, Callable[[str], str]] = {
+        "upper": str.upper,
+        "lower": str.lower,
+        "title": str.title,
+        "capitalize": str.capitalize,
+    }
+
+    TOKENIZER = re.compile(
+        r"\$\$|\$(?P<number>\d+)|\$\{(?P<group>\w+)(?::(?P<transform>\w+))?\}"
+        + r"|\\g<(?P<backref>\w+)>|\\(?P<backnumber>\d+)|\\\\"
+    )
+
+    def __init__(
+        self,
+        template: str,
+        pattern: Pattern[AnyStr],
+        parts: List[Union[str, Tuple[Union[int, str], Optional[Callable[[str], str]]]]]
+    ):
+        """Bir kez ayrıştırılıp tüm yollar için tekrar kullanılan isim şablonu
+
+        Arguments:
+            template {str} -- Şablon metni
+            pattern {Pattern[AnyStr]} -- Şablonun uygulanacağı regex
+            parts {List[Union[str, Tuple[Union[int, str], Optional[Callable[[str], str]]]]]} -- \
+                Sabit metinler ve (grup, dönüşüm) referansları
+        """
+        self.template = template
+        self.pattern = pattern
+        self.parts = parts
+
+    def __str__(self):
+        return self.template
+
+    def render(self, match: Match[str]) -> str:
+        """Şablonu tek bir eşleşmenin gruplarıyla doldurur
+
+        Eşleşmeyen gruplar boş metin olarak yazılır
+
+        Arguments:
+            match {Match[str]} -- Regex eşleşmesi
+
+        Returns:
+            str -- Oluşturulan metin
+        """
+        rendered = []
+        for part in self.parts:
+            if isinstance(part, str):
+                rendered.append(part)
+            else:
+                group, transform = part
+                value = match.group(group) or ""
+                rendered.append(transform(value) if transform else value)
+
+        return "".join(rendered)
+
+    def apply(self, string: str) -> str:
+        """Metindeki her eşleşmeyi, kendi gruplarıyla doldurulan şablon ile değiştirir
+
+        Arguments:
+            string {str} -- Metin
+
+        Returns:
+            str -- Yeni metin
+
+        Examples:
+            >>> template = RenameTemplate.from_string(
+            ...     "${name:upper}_$2.md", re.compile(r"(?P<name>\\w+) (\\d+)\\.md")
+            ... )
+            >>> template.apply("ders 12.md")
+            'DERS_12.md'
+            >>> template.apply("ders.md")
+            'ders.md'
+        """
+        return self.pattern.sub(self.render, string)
+
+    @classmethod
+    def from_string(cls, template: str, pattern: Pattern[AnyStr]) -> "RenameTemplate":
+        """Şablon metnini ayrıştırır
+
+        Desteklenen referanslar: `$N`, `${N}`, `${isim}`, `${N:upper}` (`upper`, `lower`, \
+            `title`, `capitalize`), `\\N`, `\\g<isim>`. `$$` ve `\\\\` kaçış karakteridir.
+
+        Arguments:
+            template {str} -- Şablon metni
+            pattern {Pattern[AnyStr]} -- Şablonun uygulanacağı regex
+
+        Raises:
+            re.error -- Regex'te olmayan grup veya bilinmeyen dönüşüm kullanılırsa
+
+        Returns:
+            RenameTemplate -- Derlenmiş şablon
+
+        Examples:
+            >>> RenameTemplate.from_string("$2$1", re.compile("(re)(ad)")).apply("readme")
+            'adreme'
+            >>> RenameTemplate.from_string("$3", re.compile("(re)(ad)"))
+            Traceback (most recent call last):
+            ...
+            re.error: invalid group reference 3
+        """
+        parts = []
+        literal = []
+        end = 0
+        for token in cls.TOKENIZER.finditer(template):
+            literal.append(template[end:token.start()])
+            end = token.end()
+
+            text = token.group()
+            if text in ("$$", "\\\\"):
+                literal.append(text[0])
+                continue
+
+            group = token.group("number") or token.group("group") \
+                or token.group("backref") or token.group("backnumber")
+            if group.isdigit():
+                group = int(group)
+                if group > pattern.groups:
+                    raise re.error(f"invalid group reference {group}")
+            elif group not in pattern.groupindex:
+                raise re.error(f"unknown group name {group!r}")
+
+            transform = None
+            if token.group("transform"):
+                transform = cls.TRANSFORMS.get(token.group("transform"))
+                if not transform:
+                    raise re.error(f"unknown transform {token.group('transform')!r}")
+
+            if "".join(literal):
+                parts.append("".join(literal))
+            literal = []
+            parts.append((group, transform))
+
+        literal.append(template[end:])
+        if "".join(literal):
+            parts.append("".join(literal))
+
+        return cls(template, pattern, parts)
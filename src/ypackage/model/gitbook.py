@@ -184,6 +184,23 @@ class OptionParser(common.Base):
             help="The depth limit of any methods works `0` for only main folder",
             type=int
         )
+        self.parser.add_argument(
+            "--jobs",
+            "-j",
+            default=1,
+            dest="jobs",
+            help="Number of threads that generate `README.md` files and download submodule "
+            + "`SUMMARY.md` files in parallel",
+            type=int
+        )
+        self.parser.add_argument(
+            "--no-cache",
+            "-nc",
+            action="store_true",
+            dest="no_cache",
+            help="Do not use or update the title, summary and HTTP caches in "
+            + "`.ygitbookintegration_cache` directory",
+        )
         self.parser.add_argument(
             "--debug",
             "-d",
@@ -217,13 +234,22 @@ class OptionParser(common.Base):
             dest="commit_msg",
             help="Commit message for push event",
         )
+        self.parser.add_argument(
+            "--commit-backend",
+            "-cb",
+            dest="commit_backend",
+            choices=["git", "pydriller"],
+            default="git",
+            help="Backend that reads commits for `CHANGELOG.md`, `git` runs a single `git log` process",
+        )
         self.parser.add_argument(
             "--ignore-commits",
             "-ic",
             nargs="+",
             metavar="ignore_commits",
             default=[],
-            help="The commit title which won't be added to `CHANGELOG.md` file",
+            help="Commit titles which won't be added to `CHANGELOG.md` file, plain values match anywhere "
+            + "in the title, `re:` prefixed values are regexes and `glob:` prefixed values are globs",
         )
         self.parser.add_argument(
             "--index",
@@ -238,7 +264,8 @@ class OptionParser(common.Base):
             nargs="+",
             metavar="ignore",
             default=[],
-            help="List of folder and file names that will ignored",
+            help="List of `.gitignore` style patterns for folders and files that will ignored, "
+            + "`.gitignore` and `.ygitbookignore` files are also respected",
         )
         self.parser.add_argument(
             "--footer-path",
@@ -270,11 +297,14 @@ class Options(common.Options):
         generate=False,
         changelog=False,
         depth_limit=-1,
+        jobs=1,
+        no_cache=False,
         debug=False,
         store=False,
         push=False,
         repo_url="",
         commit_msg="",
+        commit_backend="git",
         ignore_commits: List[str] = [],
         ignore: List[str] = [],
         index="",
@@ -291,11 +321,14 @@ class Options(common.Options):
         self.generate = generate
         self.changelog = changelog
         self.depth_limit = depth_limit
+        self.jobs = jobs
+        self.no_cache = no_cache
         self.debug = debug
         self.store = store
         self.push = push
         self.repo_url = repo_url
         self.commit_msg = commit_msg
+        self.commit_backend = commit_backend
         self.ignore_commits = ignore_commits
         self.ignore = ignore
         self.index = index
@@ -338,11 +371,14 @@ class Options(common.Options):
         self.generate = args.generate
         self.changelog = args.changelog
         self.depth_limit = args.depth_limit
+        self.jobs = args.jobs
+        self.no_cache = args.no_cache
         self.debug = args.debug
         self.store = args.store
         self.push = args.push
         self.repo_url = args.repo_url
         self.commit_msg = args.commit_msg
+        self.commit_backend = args.commit_backend
         self.ignore_commits = args.ignore_commits
         self.ignore = args.ignore
         self.index = args.index
@@ -0,0 +1,149 @@
+import re
+from datetime import datetime
+from fnmatch import translate
+from pathlib import Path
+from typing import Iterable, List, Optional, Pattern
+
+from . import common
+
+
+class Commit(common.Base):
+
+    def __init__(self, hash: str, title: str, author: str, date: datetime):
+        """Changelog için gereken commit bilgileri
+
+        Arguments:
+            hash {str} -- Commit hash değeri
+            title {str} -- Commit mesajının ilk satırı
+            author {str} -- Commit sahibinin ismi
+            date {datetime} -- Commit sahibinin commit tarihi
+        """
+        self.hash = hash
+        self.title = title
+        self.author = author
+        self.date = date
+
+    def __str__(self):
+        return f"{self.hash[:7]} {self.title}"
+
+
+class CommitFilter(common.Base):
+
+    PREFIX_REGEX = "re:"
+    PREFIX_GLOB = "glob:"
+
+    def __init__(self, patterns: List[str], regex: Optional[Pattern[str]]):
+        """Commit başlıklarını atlamak için tek regex'e derlenmiş filtre
+
+        Arguments:
+            patterns {List[str]} -- Filtrenin oluşturulduğu şablonlar
+            regex {Optional[Pattern[str]]} -- Tüm şablonların birleşimi, şablon yoksa `None`
+        """
+        self.patterns = patterns
+        self.regex = regex
+
+    def __str__(self):
+        return ", ".join(self.patterns)
+
+    def is_ignored(self, title: str) -> bool:
+        return bool(self.regex and self.regex.search(title))
+
+    @classmethod
+    def translate(cls, pattern: str) -> str:
+        if pattern.startswith(cls.PREFIX_REGEX):
+            return f"(?:{pattern[len(cls.PREFIX_REGEX):]})"
+
+        if pattern.startswith(cls.PREFIX_GLOB):
+            return f"^{translate(pattern[len(cls.PREFIX_GLOB):])}"
+
+        return re.escape(pattern)
+
+    @classmethod
+    def from_patterns(cls, patterns: Iterable[str], substrings: Iterable[str] = ()) -> "CommitFilter":
+        """Şablonları tek bir regex'te birleştirir
+
+        Düz şablonlar başlığın herhangi bir yerinde aranır; `re:` ile başlayanlar regex, \
+            `glob:` ile başlayanlar tüm başlıkla eşleşmesi gereken glob olarak kullanılır.
+
+        Arguments:
+            patterns {Iterable[str]} -- Şablonlar
+
+        Keyword Arguments:
+            substrings {Iterable[str]} -- Ön ek yorumlanmadan aranacak metinler (default: {()})
+
+        Raises:
+            re.error -- Geçersiz regex şablonu verilirse
+
+        Returns:
+            CommitFilter -- Filtre
+
+        Examples:
+            >>> commit_filter = CommitFilter.from_patterns(["💫", "re:^Merge (branch|pull)", "glob:v*.*"])
+            >>> [commit_filter.is_ignored(title) for title in ["💫 Güncelleme", "Merge pull #1", "v1.2", "Fix v1.2"]]
+            [True, True, True, False]
+        """
+        patterns = [pattern for pattern in patterns if pattern]
+        substrings = [substring for substring in substrings if substring]
+
+        alternatives = [cls.translate(pattern) for pattern in patterns] \
+            + [re.escape(substring) for substring in substrings]
+        regex = re.compile("|".join(alternatives)) if alternatives else None
+
+        return cls(patterns + substrings, regex)
+
+
+class GitResult(common.Base):
+
+    def __init__(self, args: List[str], returncode: int, output: str):
+        """Çalıştırılan git komutunun sonucu
+
+        Arguments:
+            args {List[str]} -- `git` sonrasındaki argümanlar
+            returncode {int} -- Çıkış kodu
+            output {str} -- Birleştirilmiş stdout ve stderr çıktısı
+        """
+        self.args = args
+        self.returncode = returncode
+        self.output = output
+
+    def __str__(self):
+        return "git " + " ".join(self.args)
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+
+class PushResult(common.Base):
+
+    def __init__(
+        self,
+        paths: List[Path],
+        staged=False,
+        committed=False,
+        pushed=False,
+        results: Optional[List[GitResult]] = None
+    ):
+        """GitHub'a gönderme adımlarının sonucu
+
+        Arguments:
+            paths {List[Path]} -- Gönderilmek istenen dosyalar
+
+        Keyword Arguments:
+            staged {bool} -- Dosyalar eklendiyse `True` (default: {False})
+            committed {bool} -- Commit oluşturulduysa `True` (default: {False})
+            pushed {bool} -- Push yapıldıysa `True` (default: {False})
+            results {Optional[List[GitResult]]} -- Çalıştırılan komutların sonuçları (default: {None})
+        """
+        self.paths = paths
+        self.staged = staged
+        self.committed = committed
+        self.pushed = pushed
+        self.results = results if results else []
+
+    def __str__(self):
+        return f"{len(self.paths)} dosya, staged={self.staged}, committed={self.committed}, pushed={self.pushed}"
+
+    @property
+    def errors(self) -> List[GitResult]:
+        return [result for result in self.results if not result.ok]
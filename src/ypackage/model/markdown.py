@@ -1,8 +1,9 @@
 import re
-from copy import deepcopy
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Union
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Pattern,
+                    Tuple, Union)
 
 from ..core import filesystem
 from . import common
@@ -40,29 +41,47 @@ class Base(common.Base):
 
     @classmethod
     def remove_all(cls, content: str) -> str:
-        return re.sub(cls.REGEX, "", content)
+        parts, last = [], 0
+        for token in cls.find_tokens(content):
+            if token.start >= last:
+                parts.append(content[last:token.start])
+                last = token.end
+
+        parts.append(content[last:])
+        return "".join(parts)
 
     @classmethod
-    def find_all(cls, content: str) -> List[Any]:
+    def find_tokens(cls, content: str) -> List["Token"]:
         if not cls.REGEX:
             raise NotImplementedError
 
-        anylist = []
+        return [
+            Token(cls(*groups), start, end)
+            for name, start, end, groups in scan(content)
+            if name == cls.__name__
+        ]
 
-        results = re.findall(cls.REGEX, content, re.MULTILINE)
-        for result in results:
-            if not isinstance(result, tuple):
-                result = result,
+    @classmethod
+    def iter_tokens(cls, content: str) -> Iterator["Token"]:
+        if not cls.REGEX:
+            raise NotImplementedError
+
+        for name, start, end, groups in iter_scan(content):
+            if name == cls.__name__:
+                yield Token(cls(*groups), start, end)
 
-            anylist.append(cls(*result))
+    @classmethod
+    def find_all(cls, content: str) -> List[Any]:
+        return [token.element for token in cls.find_tokens(content)]
 
-        return anylist
+    @classmethod
+    def iter_all(cls, content: str) -> Iterator[Any]:
+        for token in cls.iter_tokens(content):
+            yield token.element
 
     @classmethod
     def find_first(cls, content: str) -> Optional[Any]:
-        results = cls.find_all(content)
-        if results:
-            return results[0]
+        return next(cls.iter_all(content), None)
 
     @classmethod
     def find_all_in_markdownfile(cls, filepath: Path) -> List[Any]:
@@ -76,20 +95,36 @@ class Base(common.Base):
 
     @classmethod
     def map(cls, content: str, do: Callable[[Any], None]) -> str:
-        # BUG: Tekrarlı değişiklikler oluyor (Indent için '  ' 2 kere değişiyor)
-        anylist = cls.find_all(content)
-        for anyobject in anylist:
-            oldone = deepcopy(anyobject)
-            do(anyobject)
-            content = content.replace(oldone.to_str(), anyobject.to_str())
+        """Metindeki her eleman için verilen fonksiyonu uygular ve değişen elemanların \
+            konumlarına yeni metinlerini yerleştirir
+
+        Arguments:
+            content {str} -- Metin
+            do {Callable[[Any], None]} -- Elemanı alan ve değiştiren fonksiyon
+
+        Returns:
+            str -- Değişen metin
+        """
+        parts, last = [], 0
+        for token in cls.find_tokens(content):
+            oldstring = token.element.to_str()
+            do(token.element)
+            newstring = token.element.to_str()
+
+            if newstring != oldstring:
+                parts.append(content[last:token.start])
+                parts.append(newstring)
+                last = token.end
 
-        return content
+        if not parts:
+            return content
+
+        parts.append(content[last:])
+        return "".join(parts)
 
     @classmethod
     def map_in_file(cls, filepath: Path, do: Callable[[Any], None]) -> bool:
-        content = filesystem.read_file(filepath)
-        content = cls.map(content, do)
-        return filesystem.write_to_file(filepath, content)
+        return filesystem.update_file(filepath, lambda content: cls.map(content, do))
 
 
 class Comment(Base):
@@ -198,6 +233,132 @@ class Link(Base):
             return Path(self.path)
 
 
+class Token(common.Base):
+
+    def __init__(self, element: Base, start: int, end: int):
+        """Metin içerisinde bulunan markdown elemanı ve konumu
+
+        Arguments:
+            element {Base} -- Bulunan eleman (Header, Link, Comment, Indent)
+            start {int} -- Başlangıç indeksi (dahil)
+            end {int} -- Bitiş indeksi (dahil değil)
+        """
+        self.element = element
+        self.start = start
+        self.end = end
+
+
+# Aynı konumda eşleşen elemanlar arasında öncelik sırası
+TOKEN_TYPES = (Comment, Link, Header, Indent)
+
+# Başlık metni içerisinde ayrıca aranacak elemanlar
+INLINE_TOKEN_TYPES = (Comment, Link)
+
+
+def _compile_tokenizer(types: Tuple[type, ...]) -> Tuple[Pattern, Dict[str, Tuple[int, int]]]:
+    """Verilen eleman tiplerinin regex'lerini tek bir regex altında birleştirir
+
+    Arguments:
+        types {Tuple[type, ...]} -- Birleştirilecek eleman tipleri
+
+    Returns:
+        Tuple[Pattern, Dict[str, Tuple[int, int]]] -- Birleşik regex ve her tip için \
+            (grup indeksi, alt grup sayısı) ikilisi
+    """
+    alternatives, groups, index = [], {}, 1
+    for element_type in types:
+        subgroups = re.compile(element_type.REGEX).groups
+        alternatives.append(f"(?P<{element_type.__name__}>{element_type.REGEX})")
+        groups[element_type.__name__] = (index, subgroups)
+        index += subgroups + 1
+
+    return re.compile("|".join(alternatives), re.MULTILINE), groups
+
+
+TOKENIZER = _compile_tokenizer(TOKEN_TYPES)
+INLINE_TOKENIZER = _compile_tokenizer(INLINE_TOKEN_TYPES)
+
+
+def _iter_span(
+    tokenizer: Tuple[Pattern, Dict[str, Tuple[int, int]]],
+    content: str,
+    start: int,
+    end: int
+) -> Iterator[Tuple[str, int, int, Tuple[str, ...]]]:
+    pattern, groups = tokenizer
+
+    for match in pattern.finditer(content, start, end):
+        name = match.lastgroup
+        index, subgroups = groups[name]
+        if subgroups:
+            values = match.group(*range(index + 1, index + subgroups + 1))
+            values = values if isinstance(values, tuple) else (values,)
+        else:
+            values = (match.group(index),)
+
+        yield name, match.start(), match.end(), values
+
+        if name == Header.__name__:
+            yield from _iter_span(INLINE_TOKENIZER, content, match.start(index + 2), match.end())
+
+
+def iter_scan(content: str) -> Iterator[Tuple[str, int, int, Tuple[str, ...]]]:
+    """Metni tembel olarak tarar, elemanları bulundukça döndürür
+
+    Arguments:
+        content {str} -- Markdown metni
+
+    Returns:
+        Iterator -- (tip ismi, başlangıç, bitiş, gruplar) dörtlüleri
+
+    Examples:
+        >>> next(iter_scan('<!--a--> # b'))
+        ('Comment', 0, 8, ('a',))
+    """
+    return _iter_span(TOKENIZER, content, 0, len(content))
+
+
+@lru_cache(maxsize=32)
+def scan(content: str) -> Tuple[Tuple[str, int, int, Tuple[str, ...]], ...]:
+    """Metni tek seferde tarayıp tüm markdown elemanlarının konumlarını bulur
+
+    Aynı metin için yapılan tekrarlı aramalar (başlık, bağlantı, yorum) önbellekten \
+        karşılanır, böylece metin sadece bir kez taranır
+
+    Arguments:
+        content {str} -- Markdown metni
+
+    Returns:
+        Tuple -- (tip ismi, başlangıç, bitiş, gruplar) dörtlüleri
+
+    Examples:
+        >>> scan('# [a](b) <!--c-->')
+        (('Header', 0, 17, ('#', '[a](b) <!--c-->')), ('Link', 2, 8, ('a', 'b')), ('Comment', 9, 17, ('c',)))
+    """
+    return tuple(iter_scan(content))
+
+
+def tokenize(content: str) -> List[Token]:
+    """Metindeki tüm markdown elemanlarını konumları ile birlikte listeler
+
+    Arguments:
+        content {str} -- Markdown metni
+
+    Returns:
+        List[Token] -- Başlangıç konumuna göre sıralı eleman listesi
+
+    Examples:
+        >>> tokenize('<!--Index-->[name](path)')  # doctest: +NORMALIZE_WHITESPACE
+        [Token(element=Comment(content='Index'), start=0, end=12),
+         Token(element=Link(name='name', path='path'), start=12, end=24)]
+    """
+    types = {element_type.__name__: element_type for element_type in TOKEN_TYPES}
+    return [
+        Token(types[name](*groups), start, end)
+        for name, start, end, groups in scan(content)
+    ]
+
+
 class SpecialFile(Enum):
 
     # TODO: Bu yapının değişmesi lazım